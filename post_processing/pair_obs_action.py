@@ -93,8 +93,37 @@ def pair_closest_before(events: List[Dict], observations: List[Dict]) -> List[Tu
     return ans
 
 
+# Characters the browser escapes when serializing attribute values
+HTML_ATTR_SPECIAL_CHARS = frozenset('&<>"\'\xa0')
+# Elements whose content the browser serializes unescaped, plus comments, as
+# (opener, closer) pairs; text inside them can look like markup.
+RAW_TEXT_DELIMITERS = tuple(
+    (f"<{tag}", f"</{tag}") for tag in ("script", "style", "noscript", "iframe", "noembed", "noframes", "xmp")
+) + (("<!--", "-->"),)
+
+
+def _in_start_tag(html: str, pos: int) -> bool:
+    """Whether `pos` lies inside a start tag's attribute list, not in text/script/comments."""
+    lt = html.rfind("<", 0, pos)
+    if lt == -1 or not html[lt + 1:lt + 2].isalpha() or html.find(">", lt, pos) != -1:
+        return False
+    return all(html.rfind(opener, 0, lt) <= html.rfind(closer, 0, lt) for opener, closer in RAW_TEXT_DELIMITERS)
+
+
 def check_bid_in_html(html: str, data_bid: str) -> bool:
     """Check if data-bid exists in HTML observation."""
+    # Captured HTML is browser-serialized, so a bid without special characters is
+    # written verbatim as ` data-bid="..."`; scanning for that avoids parsing the
+    # whole document when the answer is clear.
+    needle = f' data-bid="{data_bid}"'
+    pos = html.find(needle)
+    if pos == -1 and HTML_ATTR_SPECIAL_CHARS.isdisjoint(data_bid):
+        return False
+    while pos != -1:
+        if _in_start_tag(html, pos):
+            return True
+        pos = html.find(needle, pos + 1)
+    # Only seen in text/scripts, or the bid may be entity-escaped; let the parser decide.
     try:
         soup = BeautifulSoup(html, "html.parser")
         elem = soup.find(attrs={"data-bid": data_bid})
@@ -11,11 +11,17 @@ Usage:
     uv run python process_trace.py trace.json
     uv run python process_trace.py trace.json --extract-html
     uv run python process_trace.py trace.json -o output_folder/
+    uv run python process_trace.py traces_dir/ --batch -o output_folder/
 """
 
 import json
 import os
+import glob
 import argparse
+import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
 from typing import List, Dict, Tuple, Any
 from bs4 import BeautifulSoup
 
@@ -104,8 +110,37 @@ def pair_closest_before(events: List[Dict], observations: List[Dict]) -> List[Tu
     return ans
 
 
+# Characters the browser escapes when serializing attribute values
+HTML_ATTR_SPECIAL_CHARS = frozenset('&<>"\'\xa0')
+# Elements whose content the browser serializes unescaped, plus comments, as
+# (opener, closer) pairs; text inside them can look like markup.
+RAW_TEXT_DELIMITERS = tuple(
+    (f"<{tag}", f"</{tag}") for tag in ("script", "style", "noscript", "iframe", "noembed", "noframes", "xmp")
+) + (("<!--", "-->"),)
+
+
+def _in_start_tag(html: str, pos: int) -> bool:
+    """Whether `pos` lies inside a start tag's attribute list, not in text/script/comments."""
+    lt = html.rfind("<", 0, pos)
+    if lt == -1 or not html[lt + 1:lt + 2].isalpha() or html.find(">", lt, pos) != -1:
+        return False
+    return all(html.rfind(opener, 0, lt) <= html.rfind(closer, 0, lt) for opener, closer in RAW_TEXT_DELIMITERS)
+
+
 def check_bid_in_html(html: str, data_bid: str) -> bool:
     """Check if data-bid exists in HTML observation."""
+    # Captured HTML is browser-serialized, so a bid without special characters is
+    # written verbatim as ` data-bid="..."`; scanning for that avoids parsing the
+    # whole document when the answer is clear.
+    needle = f' data-bid="{data_bid}"'
+    pos = html.find(needle)
+    if pos == -1 and HTML_ATTR_SPECIAL_CHARS.isdisjoint(data_bid):
+        return False
+    while pos != -1:
+        if _in_start_tag(html, pos):
+            return True
+        pos = html.find(needle, pos + 1)
+    # Only seen in text/scripts, or the bid may be entity-escaped; let the parser decide.
     try:
         soup = BeautifulSoup(html, "html.parser")
         elem = soup.find(attrs={"data-bid": data_bid})
@@ -315,8 +350,9 @@ def process_trace(trace_path: str, output_dir: str = ".", extract_html: bool = F
     
     # Split observations and events
     html_log, event_log = split_observation_and_event_logs(trace_data.get('events', []))
-    html_log.sort(key=lambda x: x["timestamp"])
-    event_log.sort(key=lambda x: x["timestamp"])
+    by_timestamp = itemgetter("timestamp")
+    html_log.sort(key=by_timestamp)
+    event_log.sort(key=by_timestamp)
     
     # Combine to key events
     key_events = combine_and_map_events(event_log)
@@ -430,6 +466,82 @@ def process_trace(trace_path: str, output_dir: str = ".", extract_html: bool = F
     }
 
 
+def _batch_output_dirs(trace_paths: List[str], output_dir: str) -> List[str]:
+    """
+    Per-trace output folders: each trace's path relative to the traces' common
+    folder, without .json (a trace.json is named after its folder instead).
+
+    Mirroring the relative path keeps a/trace_1.json and b/trace_1.json apart;
+    any name still shared by two traces gets a short hash of the trace path.
+    """
+    abs_paths = [os.path.abspath(path) for path in trace_paths]
+    root = os.path.commonpath([os.path.dirname(path) for path in abs_paths])
+    names = []
+    for path in abs_paths:
+        name = os.path.splitext(os.path.relpath(path, root))[0]
+        folder, stem = os.path.split(name)
+        if stem == "trace":
+            name = folder or os.path.basename(root)
+        names.append(name)
+    counts = Counter(names)
+    return [
+        os.path.join(output_dir, name if counts[name] == 1 else f"{name}_{hashlib.blake2b(path.encode(), digest_size=4).hexdigest()}")
+        for name, path in zip(names, abs_paths)
+    ]
+
+
+def _process_one(trace_path: str, trace_output_dir: str, extract_html: bool) -> Dict:
+    """Worker entry point: process a single trace and return only its stats."""
+    result = process_trace(trace_path, trace_output_dir, extract_html)
+    return {"trace": trace_path, "output_dir": trace_output_dir, "stats": result["stats"]}
+
+
+def process_traces(trace_paths: List[str], output_dir: str = ".", extract_html: bool = False) -> List[Dict]:
+    """
+    Process many independent traces in parallel, one worker process per core.
+
+    Each trace is written to its own subfolder of output_dir (see _batch_output_dirs).
+    Returns a dict per trace, in the same order as trace_paths: {"trace",
+    "output_dir", "stats"} on success, or {"trace", "output_dir", "error"} if
+    that trace failed; one failure does not stop the rest of the batch.
+    """
+    if not trace_paths:
+        return []
+    output_dirs = _batch_output_dirs(trace_paths, output_dir)
+    results: List[Dict] = [None] * len(trace_paths)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = {
+            ex.submit(_process_one, trace_path, trace_output_dir, extract_html): idx
+            for idx, (trace_path, trace_output_dir) in enumerate(zip(trace_paths, output_dirs))
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                print(f"❌ Failed to process {trace_paths[idx]}: {e}")
+                results[idx] = {"trace": trace_paths[idx], "output_dir": output_dirs[idx], "error": str(e)}
+    return results
+
+
+TRACE_FILE_PATTERNS = ("trace.json", "trace_*.json")
+# This script's own outputs, which also start with "trace_"
+TRACE_OUTPUT_SUFFIXES = ("_bgym_actions.json",)
+
+
+def find_trace_files(trace_dir: str) -> List[str]:
+    """Find trace.json / trace_*.json files in a directory (including one level of task folders)."""
+    patterns = [
+        os.path.join(trace_dir, *level, name)
+        for level in ((), ("*",))
+        for name in TRACE_FILE_PATTERNS
+    ]
+    return sorted(
+        path for pattern in patterns for path in glob.glob(pattern)
+        if not path.endswith(TRACE_OUTPUT_SUFFIXES)
+    )
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Process trace.json - Complete pipeline for all outputs",
@@ -440,12 +552,24 @@ Examples:
   uv run python process_trace.py trace.json -o results/
   uv run python process_trace.py trace.json --extract-html
   uv run python process_trace.py path/to/trace.json -o output/ --extract-html
+  uv run python process_trace.py traces/ --batch -o output/
         """
     )
-    parser.add_argument("trace", help="Path to trace.json file")
+    parser.add_argument("trace", help="Path to trace.json file (or a directory with --batch)")
     parser.add_argument("-o", "--output", default=".", help="Output directory (default: current)")
     parser.add_argument("--extract-html", action="store_true", help="Extract HTML snapshots to files")
+    parser.add_argument("--batch", action="store_true", help="Process every trace.json / trace_*.json under the given directory in parallel")
     
     args = parser.parse_args()
-    process_trace(args.trace, args.output, args.extract_html)
+    if args.batch:
+        trace_paths = find_trace_files(args.trace)
+        if not trace_paths:
+            parser.error(f"no trace.json / trace_*.json files found in {args.trace}")
+        results = process_traces(trace_paths, args.output, args.extract_html)
+        failed = [r for r in results if "error" in r]
+        print(f"\n✨ Processed {len(results) - len(failed)} traces into {os.path.abspath(args.output)}/")
+        if failed:
+            print(f"❌ {len(failed)} traces failed: {[r['trace'] for r in failed]}")
+    else:
+        process_trace(args.trace, args.output, args.extract_html)
 
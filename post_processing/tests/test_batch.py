@@ -0,0 +1,51 @@
+"""Tests for --batch trace discovery and processing (find_trace_files, process_traces)."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("bs4")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import process_trace  # noqa: E402
+
+
+def _write_trace(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"events": [
+        {"type": "htmlCapture", "timestamp": 0, "html": '<button data-bid="5">x</button>'},
+        {"type": "click", "timestamp": 1, "target": {"bid": "5", "tag": "button"}},
+    ]}))
+
+
+def test_find_trace_files_skips_outputs(tmp_path):
+    _write_trace(tmp_path / "trace_1.json")
+    _write_trace(tmp_path / "task1" / "trace.json")
+    (tmp_path / "trace_bgym_actions.json").write_text("{}")
+    (tmp_path / "task1" / "trace_bgym_actions.json").write_text("{}")
+    (tmp_path / "traces.json").write_text("{}")
+
+    assert process_trace.find_trace_files(str(tmp_path)) == [
+        str(tmp_path / "task1" / "trace.json"),
+        str(tmp_path / "trace_1.json"),
+    ]
+
+
+def test_batch_twice_over_same_folder(tmp_path, monkeypatch):
+    _write_trace(tmp_path / "trace_1.json")
+    _write_trace(tmp_path / "task1" / "trace.json")
+    monkeypatch.chdir(tmp_path)
+
+    runs = []
+    for _ in range(2):
+        trace_paths = process_trace.find_trace_files(".")
+        runs.append((trace_paths, process_trace.process_traces(trace_paths)))
+
+    (first_paths, first_results), (second_paths, second_results) = runs
+    assert second_paths == first_paths == [os.path.join(".", "task1", "trace.json"), os.path.join(".", "trace_1.json")]
+    assert [r["output_dir"] for r in second_results] == [r["output_dir"] for r in first_results]
+    assert not any("error" in r for r in first_results + second_results)
+    assert (tmp_path / "trace_1" / "trace_bgym_actions.json").exists()
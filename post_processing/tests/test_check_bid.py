@@ -0,0 +1,33 @@
+"""Tests for check_bid_in_html's substring fast path against the HTML parser."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("bs4")
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pair_obs_action  # noqa: E402
+import process_trace  # noqa: E402
+
+CASES = [
+    ('<div data-bid="5">x</div>', "5", True),
+    ('<p>text data-bid="5" here</p>', "5", False),
+    ("<script>var s = '<a data-bid=\"5\">';</script><p></p>", "5", False),
+    ('<style>a[data-bid="9"] {}</style>', "9", False),
+    ('<!-- <a data-bid="5"> --><p data-bid="6"></p>', "5", False),
+    ('<!-- <a data-bid="5"> --><p data-bid="6"></p>', "6", True),
+    ('<script></script><b data-bid="9">', "9", True),
+    ('<a title="x>y" data-bid="7">', "7", True),
+    ('<a data-bid="a&amp;b">', "a&b", True),
+    ('<div data-bid="1"></div>', "10", False),
+]
+
+
+@pytest.mark.parametrize("module", [process_trace, pair_obs_action])
+@pytest.mark.parametrize("html, bid, expected", CASES)
+def test_check_bid_in_html_matches_parser(module, html, bid, expected):
+    assert (BeautifulSoup(html, "html.parser").find(attrs={"data-bid": bid}) is not None) is expected
+    assert module.check_bid_in_html(html, bid) is expected
@@ -8,6 +8,7 @@ For observation-action pairing, use pair_obs_action.py instead.
 """
 
 import json
+from operator import itemgetter
 from typing import List, Dict, Any
 
 
@@ -118,7 +119,7 @@ def trace_to_bgym_actions(trace_path: str, output_path: str):
     print(f"Total events before processing: {len(event_log)}")
     
     # Sort by timestamp
-    event_log.sort(key=lambda x: x["timestamp"])
+    event_log.sort(key=itemgetter("timestamp"))
     
     # Combine and filter to key events
     key_events = combine_and_map_events(event_log)
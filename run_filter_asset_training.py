@@ -155,7 +155,9 @@ def save_payload(payload):
   runs_dir.mkdir(parents=True, exist_ok=True)
   task_id = f"task_{int(datetime.now(timezone.utc).timestamp() * 1000)}"
   training_path = runs_dir / f"{task_id}.json"
-  training_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+  # Serialize once; the same bytes are written to both destinations.
+  encoded = json.dumps(payload, indent=2).encode("utf-8")
+  training_path.write_bytes(encoded)
   print(f"Saved training payload (intermediate-format) to: {training_path}")
 
   # 2) Mirror into project_root/intermediate/<ISO>/payload.json like the server
@@ -168,7 +170,7 @@ def save_payload(payload):
   metadata_path = folder / "metadata.json"
 
   # payload.json is just the payload object
-  payload_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+  payload_path.write_bytes(encoded)
 
   metadata_json = {
       "savedAt": datetime.now(timezone.utc).isoformat(),
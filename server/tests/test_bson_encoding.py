@@ -0,0 +1,78 @@
+"""Tests for JSON encoding of Mongo documents (_bson_default, _stream_documents)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+from bson import Binary, DBRef, Decimal128, MaxKey, MinKey, ObjectId, Regex, Timestamp
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server  # noqa: E402
+
+
+def _encode(value):
+    return orjson.loads(orjson.dumps(value, default=server._bson_default))
+
+
+def test_bson_values_encode():
+    oid = ObjectId("6ad1ca0913d2b69e1627ec76")
+    doc = {
+        "id": oid,
+        "price": Decimal128("1.50"),
+        "blob": Binary(b"\x00\xff"),
+        "raw": b"hi",
+        "ts": Timestamp(1, 2),
+        "re": Regex("a", 0),
+        "ref": DBRef("c", oid),
+        "min": MinKey(),
+        "max": MaxKey(),
+    }
+
+    assert _encode(doc) == {
+        "id": str(oid),
+        "price": "1.50",
+        "blob": "AP8=",
+        "raw": "aGk=",
+        "ts": "Timestamp(1, 2)",
+        "re": "Regex('a', 0)",
+        "ref": {"$ref": "c", "$id": str(oid)},
+        "min": "MinKey()",
+        "max": "MaxKey()",
+    }
+
+
+def test_bson_subclasses_encode():
+    class TaggedId(ObjectId):
+        pass
+
+    class Money(Decimal128):
+        pass
+
+    oid = TaggedId("6ad1ca0913d2b69e1627ec76")
+
+    assert _encode({"id": oid, "price": Money("2.5")}) == {"id": str(oid), "price": "2.5"}
+
+
+def test_unknown_types_still_raise():
+    with pytest.raises(TypeError):
+        orjson.dumps({"x": object()}, default=server._bson_default)
+
+
+def test_stream_ends_array_cleanly_on_unencodable_document():
+    async def cursor():
+        yield {"a": 1}
+        yield {"b": object()}
+        yield {"c": 3}
+
+    async def collect():
+        return b"".join([chunk async for chunk in server._stream_documents(b'{"a":0}', cursor())])
+
+    body = orjson.loads(asyncio.run(collect()))
+
+    assert body["documents"] == [{"a": 0}, {"a": 1}]
+    assert "not JSON serializable" in body["error"]
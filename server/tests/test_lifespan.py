@@ -0,0 +1,52 @@
+"""Tests that the app can start and stop more than once in the same process."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server  # noqa: E402
+
+
+@pytest.fixture
+def local_only(monkeypatch, tmp_path):
+    """Run without Mongo or S3, mirroring payloads under a temporary folder."""
+    uploads = []
+
+    def fake_upload(html, metadata):
+        uploads.append(html)
+        return f"https://example.invalid/{len(uploads)}.html"
+
+    monkeypatch.setattr(server, "require_configuration", lambda: None)
+    monkeypatch.setattr(server, "client", None)
+    monkeypatch.setattr(server, "INTERMEDIATE_ROOT", tmp_path)
+    monkeypatch.setattr(server, "generate_file_url", fake_upload)
+    return uploads
+
+
+def test_events_ingest_across_two_lifespans(local_only):
+    payload = {"task": "t", "duration": 1, "events_recorded": 1, "data": [{"type": "click", "html": "<p></p>"}]}
+
+    for _ in range(2):
+        with TestClient(server.app) as test_client:
+            response = test_client.post("/api/events", json=payload)
+            assert response.status_code == 200, response.text
+            assert response.json()["success"] is True
+
+    assert local_only == ["<p></p>", "<p></p>"]
+    assert server._S3_EXECUTOR is None
+
+
+def test_events_without_uploads_skip_the_executor(local_only):
+    record = server.asyncio.run(server._prepare_event_record(
+        server.EventPayload(task="t", duration=1, events_recorded=1, data=[{"type": "click"}]), "iso"
+    ))
+
+    assert record["video_url"] == ""
+    assert local_only == []
@@ -0,0 +1,57 @@
+"""Tests for the startup Mongo ping and its background reconnect task."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server  # noqa: E402
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Start with Mongo marked unavailable and record reconnect delays."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(server, "DB_AVAILABLE", False)
+    monkeypatch.setattr(server.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def test_retry_ping_backs_off_until_mongo_answers(monkeypatch, offline):
+    attempts = []
+
+    async def fake_ping(timeout=server.MONGO_PING_TIMEOUT_S):
+        attempts.append(timeout)
+        if len(attempts) < 7:
+            raise RuntimeError("unreachable")
+
+    monkeypatch.setattr(server, "_ping_mongo", fake_ping)
+
+    asyncio.run(server._retry_ping())
+
+    assert offline == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+    assert attempts == [server.MONGO_PING_RETRY_TIMEOUT_S] * 7
+    assert server.DB_AVAILABLE is True
+
+
+def test_shutdown_cancels_retry_task(monkeypatch):
+    monkeypatch.setattr(server, "DB_AVAILABLE", False)
+    monkeypatch.setattr(server, "_S3_EXECUTOR", server.ThreadPoolExecutor(max_workers=1))
+
+    async def run():
+        task = asyncio.create_task(server._retry_ping())
+        monkeypatch.setattr(server, "_PING_RETRY_TASK", task)
+        await asyncio.sleep(0)
+        await server.shutdown_event()
+        return task
+
+    assert asyncio.run(run()).cancelled()
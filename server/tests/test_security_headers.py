@@ -0,0 +1,39 @@
+"""Tests for SecurityHeadersMiddleware."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server  # noqa: E402
+
+
+def _response_headers(headers):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = server.SecurityHeadersMiddleware(app)
+    asyncio.run(middleware({"type": "http"}, None, send))
+    return sent[0]["headers"]
+
+
+def test_security_headers_added():
+    headers = _response_headers([(b"content-type", b"application/json")])
+
+    assert headers == [(b"content-type", b"application/json"), *server.SECURITY_HEADERS]
+
+
+def test_security_headers_replace_existing_values():
+    headers = _response_headers([(b"Cache-Control", b"max-age=60"), (b"x-content-type-options", b"nosniff")])
+
+    assert headers == list(server.SECURITY_HEADERS)
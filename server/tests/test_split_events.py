@@ -0,0 +1,102 @@
+"""Tests for /api/events?split_events=true storage (_insert_split_events)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+from pymongo import WriteConcern
+from pymongo.errors import OperationFailure
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server  # noqa: E402
+
+
+class FakeCollection:
+    """In-memory stand-in for a Motor collection handle.
+
+    Handles created over the same `docs` list behave like one collection seen
+    with different write concerns, as _build_collection_cache sets them up.
+    Mirrors pymongo's refusal of bypass_document_validation on w=0 writes.
+    """
+
+    def __init__(self, docs, acknowledged=True, fail_insert=False):
+        self.docs = docs
+        self.write_concern = WriteConcern(w=1 if acknowledged else 0)
+        self.fail_insert = fail_insert
+
+    def _check(self, bypass_document_validation):
+        if bypass_document_validation and not self.write_concern.acknowledged:
+            raise OperationFailure("Cannot set bypass_document_validation with unacknowledged write concern")
+        if self.fail_insert:
+            raise OperationFailure("insert failed")
+
+    async def insert_many(self, documents, ordered=True, bypass_document_validation=False):
+        self._check(bypass_document_validation)
+        self.docs.extend(documents)
+
+    async def insert_one(self, document, bypass_document_validation=False):
+        self._check(bypass_document_validation)
+        self.docs.append(document)
+
+    async def delete_many(self, filter):
+        self.docs[:] = [doc for doc in self.docs if any(doc.get(k) != v for k, v in filter.items())]
+
+    async def delete_one(self, filter):
+        for idx, doc in enumerate(self.docs):
+            if all(doc.get(k) == v for k, v in filter.items()):
+                del self.docs[idx]
+                return
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    """Install fake event/event-item handles; returns their backing lists."""
+    runs, items = [], []
+
+    def install(fail_run_insert=False):
+        for acknowledged, handles in ((True, server._EVENT_COLLECTIONS), (False, server._FAST_EVENT_COLLECTIONS)):
+            monkeypatch.setitem(handles, server.EVENT_COLLECTION, FakeCollection(runs, acknowledged, fail_run_insert))
+            monkeypatch.setitem(handles, server.EVENT_ITEMS_COLLECTION, FakeCollection(items, acknowledged))
+        return runs, items
+
+    return install
+
+
+def _document():
+    return {"task": "t", "duration": 1, "data": [{"type": "click"}, {"type": "input"}], "timestamp": "now"}
+
+
+@pytest.mark.parametrize("fast_insert", [False, True])
+def test_split_events_with_fast_insert(collections, fast_insert):
+    runs, items = collections()
+
+    run_id = asyncio.run(server._insert_split_events(_document(), fast_insert=fast_insert))
+
+    assert [run["_id"] for run in runs] == [run_id]
+    assert "data" not in runs[0]
+    assert [item["_run"] for item in items] == [run_id, run_id]
+
+
+@pytest.mark.parametrize("fast_insert", [False, True])
+def test_split_events_cleans_up_items_when_run_insert_fails(collections, fast_insert):
+    runs, items = collections(fail_run_insert=True)
+
+    with pytest.raises(OperationFailure):
+        asyncio.run(server._insert_split_events(_document(), fast_insert=fast_insert))
+
+    assert runs == []
+    assert items == []
+
+
+def test_event_items_not_exposed_through_v1(monkeypatch):
+    monkeypatch.setattr(server, "ALLOWED_DB", "db")
+    monkeypatch.setattr(server, "_COLL_CACHE", {})
+
+    assert server.EVENT_ITEMS_COLLECTION not in server.ALLOWED_COLLECTIONS
+    with pytest.raises(server.HTTPException) as excinfo:
+        server.get_collection("db", server.EVENT_ITEMS_COLLECTION)
+    assert excinfo.value.detail == "blocked collection"
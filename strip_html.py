@@ -2,37 +2,56 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to stdlib json
+    orjson = None
+
 TRACE_PATH = Path("/Users/siddharthsuresh/Downloads/event-capture-archives/2025-11-18T02-20-01-939Z/trace.json")
 OUTPUT_PATH = Path("corrected_html.json")
 
 def strip_html(obj):
-    if isinstance(obj, dict):
-        return {k: strip_html(v) for k, v in obj.items() if k != "html"}
-    if isinstance(obj, list):
-        return [strip_html(v) for v in obj]
+    """Drop every "html" key from obj in place (iteratively) and return it."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node.pop("html", None)
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
     return obj
 
+def load_json(raw: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json(obj, indent=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
 def main():
-    text = TRACE_PATH.read_text(encoding="utf-8")
+    raw = TRACE_PATH.read_bytes()
 
     # Try full JSON first, fall back to JSONL if needed
+    # (orjson.JSONDecodeError subclasses json.JSONDecodeError)
     try:
-        data = json.loads(text)
+        data = load_json(raw)
         mode = "json"
     except json.JSONDecodeError:
-        lines = [ln for ln in text.splitlines() if ln.strip()]
-        data = [json.loads(ln) for ln in lines]
+        data = [load_json(ln) for ln in raw.splitlines() if ln.strip()]
         mode = "jsonl"
 
     cleaned = strip_html(data)
 
-    with OUTPUT_PATH.open("w", encoding="utf-8") as f:
-        if mode == "json":
-            json.dump(cleaned, f, indent=2)
-        else:  # jsonl
-            for obj in cleaned:
-                json.dump(obj, f)
-                f.write("\n")
+    if mode == "json":
+        OUTPUT_PATH.write_bytes(dump_json(cleaned, indent=True))
+    else:  # jsonl
+        OUTPUT_PATH.write_bytes(b"".join(dump_json(obj) + b"\n" for obj in cleaned))
 
     print(f"Wrote cleaned file to {OUTPUT_PATH.resolve()}")
 
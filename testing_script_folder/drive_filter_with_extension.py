@@ -39,6 +39,8 @@ CONFIG_PATH = TESTING_ROOT / "config.yaml"
 
 
 def find_servicenow_page(page_list, instance_prefix: str) -> Optional[Page]:
+    # page.url is read from Playwright's locally tracked frame state (no CDP
+    # round-trip); read it once per page and stop at the first match.
     for page in page_list:
         try:
             url = page.url
@@ -68,10 +70,8 @@ def main() -> int:
             print(f"Failed to connect to Chrome over CDP: {exc}", file=sys.stderr)
             return 1
 
-        pages = []
-        for ctx in browser.contexts:
-            pages.extend(ctx.pages)
-
+        # Lazily walk tabs across contexts so the search stops at the first match.
+        pages = (pg for ctx in browser.contexts for pg in ctx.pages)
         page = find_servicenow_page(pages, instance_url)
         if page is None:
             print(
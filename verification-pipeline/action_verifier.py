@@ -12,15 +12,100 @@ Checks:
 import json
 import os
 import re
+import string
 from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import sys
+from collections import Counter
+from operator import itemgetter, methodcaller
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to stdlib json
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # optional dependency; large files are loaded whole instead
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency; fall back to pure Python
+    np = None
+
+# Shared empty default for partition lookups, so a missing type allocates nothing
+_NO_ACTIONS: Tuple[Dict, ...] = ()
+
+# Escapes quotes and backslashes in generated string arguments in one C-level pass
+_ESCAPE_ARG = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+# browsergym call builders keyed by action type: (bid, action) -> code
+_CODEGEN = {
+    "click": lambda bid, action: f'click("{bid}")',
+    "fill": lambda bid, action: f'fill("{bid}", "{action.get("value", "").translate(_ESCAPE_ARG)}")',
+    "select_option": lambda bid, action: f'select_option("{bid}", "{action.get("option", "").translate(_ESCAPE_ARG)}")',
+}
+
+# Action files at least this large are stream-parsed with ijson when it is installed
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Below this many steps the pure-Python Counter path beats numpy's setup cost
+NUMPY_MIN_STEPS = 10_000
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _step_issues(steps: List[Any], expected_count: int) -> Tuple[List[Any], List[Any]]:
+    """Return (gaps in 1..expected_count, duplicated steps in first-seen order)."""
+    if np is not None and len(steps) >= NUMPY_MIN_STEPS and set(map(type, steps)) == {int}:
+        try:
+            arr = np.fromiter(steps, dtype=np.int64, count=len(steps))
+        except OverflowError:
+            arr = None
+        if arr is not None:
+            uniq, first_idx, counts = np.unique(arr, return_index=True, return_counts=True)
+            repeated = counts > 1
+            order = np.argsort(first_idx[repeated], kind="stable")
+            duplicates = uniq[repeated][order].tolist()
+            expected = np.arange(1, expected_count + 1, dtype=np.int64)
+            gaps = np.setdiff1d(expected, uniq, assume_unique=True).tolist()
+            return gaps, duplicates
+    
+    step_counts = Counter(steps)
+    duplicates = [step for step, count in step_counts.items() if count > 1]
+    gaps = sorted(set(range(1, expected_count + 1)).difference(step_counts))
+    return gaps, duplicates
+
+
+def _load_actions_file(actions_path: str) -> Dict:
+    """Load an actions file, streaming just the `actions` array for very large files."""
+    if ijson is not None and os.path.getsize(actions_path) >= STREAM_MIN_BYTES:
+        # Only the actions array is kept; the raw bytes and other top-level keys
+        # are never held in memory at once.
+        with open(actions_path, 'rb') as f:
+            return {"actions": list(ijson.items(f, "actions.item", use_float=True))}
+    with open(actions_path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Counts can be keyed by None (actions without a type); stdlib json writes "null"
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@dataclass(slots=True)
 class ActionVerificationResult:
     """Result of an action verification check."""
     name: str
@@ -29,7 +114,7 @@ class ActionVerificationResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionVerificationReport:
     """Complete action verification report."""
     actions_path: str
@@ -41,16 +126,60 @@ class ActionVerificationReport:
     summary: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class _ActionScan:
+    """Per-check accumulators gathered in one pass over the actions.
+
+    The BID and element-info step lists keep at most ActionVerifier.MAX_ISSUES
+    entries; the matching *_count fields hold the exact totals.
+    """
+    action_type_counts: Dict[str, int] = field(default_factory=dict)
+    invalid_actions: List[Dict[str, Any]] = field(default_factory=list)
+    missing_bid: List[Any] = field(default_factory=list)
+    empty_bid: List[Any] = field(default_factory=list)
+    missing_bid_count: int = 0
+    empty_bid_count: int = 0
+    fill_missing: List[Any] = field(default_factory=list)
+    fill_empty: List[Any] = field(default_factory=list)
+    select_missing: List[Any] = field(default_factory=list)
+    elem_missing: List[Any] = field(default_factory=list)
+    elem_incomplete: List[Any] = field(default_factory=list)
+    elem_missing_count: int = 0
+    elem_incomplete_count: int = 0
+    invalid_codes: List[Dict[str, Any]] = field(default_factory=list)
+    action_distribution: Counter = field(default_factory=Counter)
+
+
 class ActionVerifier:
     """Verifies BrowserGym action extraction."""
     
-    VALID_ACTIONS = ["click", "fill", "select_option", "scroll", "noop", "hover"]
-    ACTION_PATTERN = re.compile(r'^(click|fill|select_option|scroll|noop|hover)\(["\']?[^"\']*["\']?(?:,\s*["\']?[^"\']*["\']?)?\)$')
+    VALID_ACTIONS = frozenset({"click", "fill", "select_option", "scroll", "noop", "hover"})
+    # Anchored, so ACTION_PATTERN.match checks the whole string; each argument is either
+    # quoted or a bare token, so there is no backtracking between optional quotes
+    ACTION_PATTERN = re.compile(r'\A(?:click|fill|hover|scroll|noop|select_option)\((?:"[^"]*"|\'[^\']*\'|[^"\',()]*)(?:,\s*(?:"[^"]*"|\'[^\']*\'|[^"\',()]*))?\)\Z')
+    # Characters allowed in a generated call name (what `^[a-z_]+\(` used to accept)
+    _CALL_NAME_CHARS = frozenset(string.ascii_lowercase + "_")
+    # Step numbers kept per issue list; reports only show the first few, the counts stay exact
+    MAX_ISSUES = 1000
     
     def __init__(self, actions_data: Dict):
         self.actions_data = actions_data
         self.actions = actions_data.get("actions", [])
         self.results: List[ActionVerificationResult] = []
+        self._scan_cache: _ActionScan = None
+        # Per-field columns (step falls back to the index) and actions partitioned
+        # by their "action" value, so the checks index lists instead of re-reading
+        # dicts. Each column is a single C-level map over the actions.
+        try:
+            self._steps: List[Any] = list(map(itemgetter("step"), self.actions))
+        except KeyError:
+            self._steps = [a.get("step", idx) for idx, a in enumerate(self.actions)]
+        self._types: List[Any] = list(map(methodcaller("get", "action"), self.actions))
+        self._bids: List[Any] = list(map(methodcaller("get", "data_bid"), self.actions))
+        self._elem_infos: List[Any] = list(map(methodcaller("get", "element_info"), self.actions))
+        self._by_type: Dict[Any, List[Dict]] = {}
+        for kind, action in zip(self._types, self.actions):
+            self._by_type.setdefault(kind, []).append(action)
     
     def _add_result(self, name: str, passed: bool, message: str, details: Dict = None):
         """Add a verification result."""
@@ -61,6 +190,98 @@ class ActionVerifier:
             details=details or {}
         ))
     
+    def _scan(self) -> _ActionScan:
+        """Walk the actions once, collecting what every verify_* check needs.
+
+        Computed on first use and cached, so running all checks costs a single
+        pass over the actions instead of one pass per check.
+        """
+        if self._scan_cache is not None:
+            return self._scan_cache
+        scan = _ActionScan()
+        scan.action_distribution.update(self._types)
+        for kind, count in scan.action_distribution.items():
+            action_type = "unknown" if kind is None else kind
+            scan.action_type_counts[action_type] = scan.action_type_counts.get(action_type, 0) + count
+        
+        # Bind attributes used per action to locals (LOAD_FAST instead of LOAD_ATTR)
+        cap = self.MAX_ISSUES
+        valid_actions = self.VALID_ACTIONS
+        is_call_name = self._CALL_NAME_CHARS.issuperset
+        generate_code = self._generate_code
+        add_invalid_action = scan.invalid_actions.append
+        add_invalid_code = scan.invalid_codes.append
+        missing_bid = empty_bid = elem_missing = elem_incomplete = 0
+        columns = zip(self.actions, self._steps, self._types, self._bids, self._elem_infos)
+        for action, step, kind, bid, elem_info in columns:
+            # Action types
+            if kind not in valid_actions:
+                add_invalid_action({"step": step, "action_type": "unknown" if kind is None else kind})
+            
+            # BIDs
+            if bid is None:
+                missing_bid += 1
+                if missing_bid <= cap:
+                    scan.missing_bid.append(step)
+            elif bid == "":
+                empty_bid += 1
+                if empty_bid <= cap:
+                    scan.empty_bid.append(step)
+            
+            # Element info
+            if not elem_info:
+                elem_missing += 1
+                if elem_missing <= cap:
+                    scan.elem_missing.append(step)
+            elif not elem_info.get("role") and not elem_info.get("name"):
+                elem_incomplete += 1
+                if elem_incomplete <= cap:
+                    scan.elem_incomplete.append(step)
+            
+            # Code generation
+            code = generate_code(action)
+            # Validate code format: a lowercase call name followed by `(` and a quoted argument
+            paren = code.find("(")
+            name = code[:paren]
+            valid = (
+                paren > 0
+                and (name in valid_actions or is_call_name(name))
+                and code[paren + 1:paren + 2] in ('"', "'")
+            )
+            if not valid:
+                add_invalid_code({"step": action.get("step", 0), "code": code})
+        
+        scan.missing_bid_count, scan.empty_bid_count = missing_bid, empty_bid
+        scan.elem_missing_count, scan.elem_incomplete_count = elem_missing, elem_incomplete
+        
+        # Fill values / select options only need their own partitions
+        by_type = self._by_type
+        fill_missing, fill_empty = scan.fill_missing.append, scan.fill_empty.append
+        for action in by_type.get("fill", _NO_ACTIONS):
+            value = action.get("value")
+            if value is None:
+                fill_missing(action.get("step"))
+            elif value == "":
+                fill_empty(action.get("step"))
+        select_missing = scan.select_missing.append
+        for action in by_type.get("select_option", _NO_ACTIONS):
+            option = action.get("option")
+            if option is None or option == "":
+                select_missing(action.get("step"))
+        
+        self._scan_cache = scan
+        return scan
+    
+    @staticmethod
+    def _generate_code(action: Dict) -> str:
+        """Build the browsergym call string for one action."""
+        action_type = action.get("action", "")
+        bid = action.get("data_bid", "")
+        render = _CODEGEN.get(action_type)
+        if render is None:
+            return f'{action_type}("{bid}")'
+        return render(bid, action)
+    
     def verify_actions_present(self) -> bool:
         """Check if actions array exists and is non-empty."""
         has_actions = len(self.actions) > 0
@@ -74,18 +295,9 @@ class ActionVerifier:
     
     def verify_action_types(self) -> bool:
         """Verify all action types are valid."""
-        invalid_actions = []
-        action_type_counts = {}
-        
-        for idx, action in enumerate(self.actions):
-            action_type = action.get("action", "unknown")
-            action_type_counts[action_type] = action_type_counts.get(action_type, 0) + 1
-            
-            if action_type not in self.VALID_ACTIONS:
-                invalid_actions.append({
-                    "step": action.get("step", idx),
-                    "action_type": action_type
-                })
+        scan = self._scan()
+        invalid_actions = scan.invalid_actions
+        action_type_counts = scan.action_type_counts
         
         passed = len(invalid_actions) == 0
         self._add_result(
@@ -101,36 +313,30 @@ class ActionVerifier:
     
     def verify_bids_present(self) -> bool:
         """Verify all actions have data_bid."""
-        missing_bid = []
-        empty_bid = []
-        
-        for idx, action in enumerate(self.actions):
-            bid = action.get("data_bid")
-            if bid is None:
-                missing_bid.append(action.get("step", idx))
-            elif bid == "":
-                empty_bid.append(action.get("step", idx))
+        scan = self._scan()
+        missing_count, empty_count = scan.missing_bid_count, scan.empty_bid_count
         
         total = len(self.actions)
-        valid = total - len(missing_bid) - len(empty_bid)
+        valid = total - missing_count - empty_count
         
-        passed = len(missing_bid) == 0 and len(empty_bid) == 0
+        passed = missing_count == 0 and empty_count == 0
         self._add_result(
             "BIDs Present",
             passed,
-            f"All {total} actions have valid BIDs" if passed else f"{len(missing_bid) + len(empty_bid)} actions missing BIDs",
+            f"All {total} actions have valid BIDs" if passed else f"{missing_count + empty_count} actions missing BIDs",
             {
                 "total_actions": total,
                 "valid_bids": valid,
-                "missing_bid_steps": missing_bid[:5],
-                "empty_bid_steps": empty_bid[:5]
+                "missing_bid_steps": scan.missing_bid[:5],
+                "empty_bid_steps": scan.empty_bid[:5],
+                "truncated": missing_count > self.MAX_ISSUES or empty_count > self.MAX_ISSUES
             }
         )
         return passed
     
     def verify_fill_values(self) -> bool:
         """Verify fill actions have values."""
-        fill_actions = [a for a in self.actions if a.get("action") == "fill"]
+        fill_actions = self._by_type.get("fill", _NO_ACTIONS)
         
         if not fill_actions:
             self._add_result(
@@ -141,15 +347,9 @@ class ActionVerifier:
             )
             return True
         
-        missing_values = []
-        empty_values = []
-        
-        for action in fill_actions:
-            value = action.get("value")
-            if value is None:
-                missing_values.append(action.get("step"))
-            elif value == "":
-                empty_values.append(action.get("step"))
+        scan = self._scan()
+        missing_values = scan.fill_missing
+        empty_values = scan.fill_empty
         
         # Empty values might be intentional (clearing field)
         passed = len(missing_values) == 0
@@ -168,7 +368,7 @@ class ActionVerifier:
     
     def verify_select_options(self) -> bool:
         """Verify select_option actions have options."""
-        select_actions = [a for a in self.actions if a.get("action") == "select_option"]
+        select_actions = self._by_type.get("select_option", _NO_ACTIONS)
         
         if not select_actions:
             self._add_result(
@@ -179,12 +379,7 @@ class ActionVerifier:
             )
             return True
         
-        missing_options = []
-        
-        for action in select_actions:
-            option = action.get("option")
-            if option is None or option == "":
-                missing_options.append(action.get("step"))
+        missing_options = self._scan().select_missing
         
         passed = len(missing_options) == 0
         
@@ -201,23 +396,14 @@ class ActionVerifier:
     
     def verify_element_info(self) -> bool:
         """Verify element_info is present with useful data."""
-        missing_info = []
-        incomplete_info = []
-        
-        for idx, action in enumerate(self.actions):
-            elem_info = action.get("element_info", {})
-            step = action.get("step", idx)
-            
-            if not elem_info:
-                missing_info.append(step)
-            elif not elem_info.get("role") and not elem_info.get("name"):
-                incomplete_info.append(step)
+        scan = self._scan()
+        missing_count, incomplete_count = scan.elem_missing_count, scan.elem_incomplete_count
         
         total = len(self.actions)
-        with_info = total - len(missing_info)
-        complete_info = with_info - len(incomplete_info)
+        with_info = total - missing_count
+        complete_info = with_info - incomplete_count
         
-        passed = len(missing_info) < total * 0.1  # Allow 10% missing
+        passed = missing_count < total * 0.1  # Allow 10% missing
         
         self._add_result(
             "Element Info",
@@ -227,8 +413,9 @@ class ActionVerifier:
                 "total_actions": total,
                 "with_info": with_info,
                 "complete_info": complete_info,
-                "missing_info_steps": missing_info[:5],
-                "incomplete_info_steps": incomplete_info[:5]
+                "missing_info_steps": scan.elem_missing[:5],
+                "incomplete_info_steps": scan.elem_incomplete[:5],
+                "truncated": missing_count > self.MAX_ISSUES or incomplete_count > self.MAX_ISSUES
             }
         )
         return passed
@@ -238,22 +425,11 @@ class ActionVerifier:
         if not self.actions:
             return True
         
-        steps = [a.get("step", idx) for idx, a in enumerate(self.actions)]
-        expected_steps = list(range(1, len(self.actions) + 1))
+        steps = self._steps
+        expected_count = len(self.actions)
         
         # Check if steps match expected sequence
-        gaps = []
-        duplicates = []
-        seen = set()
-        
-        for step in steps:
-            if step in seen:
-                duplicates.append(step)
-            seen.add(step)
-        
-        for expected in expected_steps:
-            if expected not in seen:
-                gaps.append(expected)
+        gaps, duplicates = _step_issues(steps, expected_count)
         
         passed = len(gaps) == 0 and len(duplicates) == 0
         
@@ -262,7 +438,7 @@ class ActionVerifier:
             passed,
             f"Steps 1-{len(self.actions)} are sequential" if passed else f"Step sequence issues: {len(gaps)} gaps, {len(duplicates)} duplicates",
             {
-                "expected_steps": len(expected_steps),
+                "expected_steps": expected_count,
                 "actual_steps": len(steps),
                 "gaps": gaps[:5],
                 "duplicates": duplicates[:5]
@@ -272,28 +448,7 @@ class ActionVerifier:
     
     def verify_action_code_generation(self) -> bool:
         """Verify actions can be converted to valid browsergym code."""
-        invalid_codes = []
-        
-        for action in self.actions:
-            action_type = action.get("action", "")
-            bid = action.get("data_bid", "")
-            step = action.get("step", 0)
-            
-            # Generate code
-            if action_type == "click":
-                code = f'click("{bid}")'
-            elif action_type == "fill":
-                value = action.get("value", "").replace('"', '\\"')
-                code = f'fill("{bid}", "{value}")'
-            elif action_type == "select_option":
-                option = action.get("option", "").replace('"', '\\"')
-                code = f'select_option("{bid}", "{option}")'
-            else:
-                code = f'{action_type}("{bid}")'
-            
-            # Validate code format
-            if not re.match(r'^[a-z_]+\(["\'][^"\']*["\']', code):
-                invalid_codes.append({"step": step, "code": code})
+        invalid_codes = self._scan().invalid_codes
         
         passed = len(invalid_codes) == 0
         
@@ -313,8 +468,8 @@ class ActionVerifier:
         if not self.actions:
             return True
         
-        action_types = [a.get("action") for a in self.actions]
-        unique_types = set(action_types)
+        action_distribution = self._scan().action_distribution
+        unique_types = set(action_distribution)
         
         # Most form tasks should have at least clicks and fills
         has_click = "click" in unique_types
@@ -330,7 +485,7 @@ class ActionVerifier:
                 "unique_action_types": list(unique_types),
                 "has_click": has_click,
                 "has_fill": has_fill,
-                "action_distribution": {t: action_types.count(t) for t in unique_types}
+                "action_distribution": dict(action_distribution)
             }
         )
         return passed
@@ -352,7 +507,7 @@ class ActionVerifier:
         self.verify_action_diversity()
         
         passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        failed = len(self.results) - passed
         
         return ActionVerificationReport(
             actions_path="",
@@ -371,23 +526,29 @@ class ActionVerifier:
 
 def print_report(report: ActionVerificationReport):
     """Print verification report."""
-    print(f"\n{'─'*60}")
-    print("📋 ACTION VERIFICATION RESULTS")
-    print(f"{'─'*60}")
+    lines = [
+        f"\n{'─'*60}",
+        "📋 ACTION VERIFICATION RESULTS",
+        f"{'─'*60}",
+    ]
     
     for result in report.results:
         status = "✅" if result.passed else "❌"
-        print(f"  {status} {result.name}: {result.message}")
+        lines.append(f"  {status} {result.name}: {result.message}")
     
-    print(f"\n{'─'*60}")
-    print(f"📊 SUMMARY")
-    print(f"{'─'*60}")
-    print(f"  Total Checks: {report.total_checks}")
-    print(f"  Passed: {report.passed_checks}")
-    print(f"  Failed: {report.failed_checks}")
-    print(f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%")
-    print(f"  Actions Valid: {'✅ YES' if report.summary['actions_valid'] else '❌ NO'}")
-    print(f"{'='*60}\n")
+    lines += [
+        f"\n{'─'*60}",
+        f"📊 SUMMARY",
+        f"{'─'*60}",
+        f"  Total Checks: {report.total_checks}",
+        f"  Passed: {report.passed_checks}",
+        f"  Failed: {report.failed_checks}",
+        f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%",
+        f"  Actions Valid: {'✅ YES' if report.summary['actions_valid'] else '❌ NO'}",
+        f"{'='*60}\n",
+    ]
+    # One write instead of a print (and possible flush) per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def verify_actions(actions_path: str = None, actions_data: Dict = None, save_report: bool = True) -> ActionVerificationReport:
@@ -395,8 +556,7 @@ def verify_actions(actions_path: str = None, actions_data: Dict = None, save_rep
     if actions_data is None:
         if actions_path is None:
             raise ValueError("Must provide either actions_path or actions_data")
-        with open(actions_path, 'r', encoding='utf-8') as f:
-            actions_data = json.load(f)
+        actions_data = _load_actions_file(actions_path)
     
     verifier = ActionVerifier(actions_data)
     report = verifier.run_verification()
@@ -423,8 +583,8 @@ def verify_actions(actions_path: str = None, actions_data: Dict = None, save_rep
                 for r in report.results
             ]
         }
-        with open(report_path, 'w') as f:
-            json.dump(report_dict, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(_dumps(report_dict))
         print(f"💾 Report saved to: {report_path}")
     
     return report
@@ -9,17 +9,99 @@ Checks:
 - Browser launch capability
 """
 
+import functools
+import hashlib
+import importlib.util
 import json
 import os
+import re
 import sys
-from typing import Dict, List, Any
-from dataclasses import dataclass, field
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from importlib import metadata
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to stdlib json
+    orjson = None
 
-@dataclass
+# With --cache, passing reports are reused until the environment fingerprint changes or this many seconds pass
+CACHE_DIR = Path.home() / ".cache" / "env_verifier"
+CACHE_TTL_S = 3600
+
+_RULE = "─" * 60
+_BANNER = "=" * 60
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load .env into os.environ once per process (existing variables win)."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(override=False)
+    except ImportError:
+        pass
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj to one compact line of UTF-8 JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _probe(url: str, headers: Dict[str, str], timeout: float = 3.0, transport: Any = None) -> Dict[str, Any]:
+    """GET url with httpx and return its status code and latency."""
+    import httpx
+    with httpx.Client(timeout=timeout, http2=_is_installed("h2"), transport=transport) as client:
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    return {"status_code": response.status_code, "elapsed_ms": elapsed_ms}
+
+
+def _normalize_dist_name(name: str) -> str:
+    """PEP 503 normalisation: lowercase, runs of -_. collapsed to '-'."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_distributions() -> Dict[str, str]:
+    """Map every installed distribution's normalised name to its version.
+
+    One scan of the dist-info directories on sys.path, shared by every package check.
+    """
+    versions = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            versions.setdefault(_normalize_dist_name(name), dist.version)
+    return versions
+
+
+def _is_installed(module_name: str) -> bool:
+    """Check a top-level module is importable without executing its __init__."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@dataclass(slots=True)
 class EnvVerificationResult:
     """Result of an environment verification check."""
     name: str
@@ -28,7 +110,7 @@ class EnvVerificationResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvVerificationReport:
     """Complete environment verification report."""
     timestamp: str
@@ -42,31 +124,51 @@ class EnvVerificationReport:
 class EnvVerifier:
     """Verifies BrowserGym environment setup."""
     
-    REQUIRED_PACKAGES = [
+    REQUIRED_PACKAGES = (
         "gymnasium",
         "browsergym",
         "openai",
         "dotenv",
-    ]
+    )
+    
+    # Distribution names that differ from the import name
+    DIST_NAMES = {
+        "dotenv": "python-dotenv",
+    }
     
-    OPTIONAL_PACKAGES = [
+    OPTIONAL_PACKAGES = (
         "playwright",
         "numpy",
         "pandas",
-    ]
+    )
     
-    REQUIRED_ENV_VARS = [
+    REQUIRED_ENV_VARS = (
         "OPENAI_API_KEY",
-    ]
+    )
     
-    OPTIONAL_ENV_VARS = [
+    OPTIONAL_ENV_VARS = (
         "SNOW_INSTANCE_URL",
         "SNOW_INSTANCE_UNAME", 
         "SNOW_INSTANCE_PWD",
-    ]
+    )
+    
+    # Checks in report order; those after QUICK_CHECKS only run without --quick
+    QUICK_CHECKS = (
+        "verify_python_version",
+        "verify_required_packages",
+        "verify_optional_packages",
+        "verify_env_vars",
+        "verify_browsergym_import",
+    )
+    SLOW_CHECKS = (
+        "verify_openai_connection",
+        "verify_playwright",
+        "verify_disk_space",
+    )
     
     def __init__(self):
         self.results: List[EnvVerificationResult] = []
+        _load_env_once()
     
     def _add_result(self, name: str, passed: bool, message: str, details: Dict = None):
         """Add a verification result."""
@@ -92,19 +194,31 @@ class EnvVerifier:
         )
         return passed
     
-    def verify_required_packages(self) -> bool:
-        """Check required packages are installed."""
+    def _probe_packages(self, packages) -> Tuple[List[str], List[str], Dict[str, str]]:
+        """Split packages into (installed, missing, versions) without importing them.
+
+        Versions come from installed dist-info; a module with no dist-info that
+        find_spec can still locate counts as installed with version "unknown".
+        """
+        dists = _installed_distributions()
         installed = []
         missing = []
         versions = {}
         
-        for package in self.REQUIRED_PACKAGES:
-            try:
-                pkg = __import__(package.replace("-", "_"))
-                installed.append(package)
-                versions[package] = getattr(pkg, "__version__", "unknown")
-            except ImportError:
+        for package in packages:
+            version = dists.get(_normalize_dist_name(self.DIST_NAMES.get(package, package)))
+            if version is None and _is_installed(package.replace("-", "_")):
+                version = "unknown"
+            if version is None:
                 missing.append(package)
+            else:
+                installed.append(package)
+                versions[package] = version
+        return installed, missing, versions
+    
+    def verify_required_packages(self) -> bool:
+        """Check required packages are installed."""
+        installed, missing, versions = self._probe_packages(self.REQUIRED_PACKAGES)
         
         passed = len(missing) == 0
         
@@ -118,15 +232,7 @@ class EnvVerifier:
     
     def verify_optional_packages(self) -> bool:
         """Check optional packages."""
-        installed = []
-        missing = []
-        
-        for package in self.OPTIONAL_PACKAGES:
-            try:
-                __import__(package.replace("-", "_"))
-                installed.append(package)
-            except ImportError:
-                missing.append(package)
+        installed, missing, _ = self._probe_packages(self.OPTIONAL_PACKAGES)
         
         # Optional packages are not required
         passed = True
@@ -140,26 +246,21 @@ class EnvVerifier:
         return passed
     
     def verify_env_vars(self) -> bool:
-        """Check required environment variables."""
-        # Load dotenv if available
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            pass
-        
-        found = []
-        missing = []
-        masked = {}
+        """Check required and optional (ServiceNow) environment variables.
+
+        Reads every variable from one snapshot and records two results:
+        "Environment Variables" (required) and "ServiceNow Config" (optional).
+        Returns whether all required variables are set.
+        """
+        env = {var: os.environ.get(var) for var in self.REQUIRED_ENV_VARS + self.OPTIONAL_ENV_VARS}
         
-        for var in self.REQUIRED_ENV_VARS:
-            value = os.environ.get(var)
-            if value:
-                found.append(var)
-                # Mask sensitive values
-                masked[var] = value[:4] + "..." + value[-4:] if len(value) > 10 else "***"
-            else:
-                missing.append(var)
+        found = [var for var in self.REQUIRED_ENV_VARS if env[var]]
+        missing = [var for var in self.REQUIRED_ENV_VARS if not env[var]]
+        # Mask sensitive values
+        masked = {
+            var: env[var][:4] + "..." + env[var][-4:] if len(env[var]) > 10 else "***"
+            for var in found
+        }
         
         passed = len(missing) == 0
         
@@ -169,30 +270,20 @@ class EnvVerifier:
             f"All {len(self.REQUIRED_ENV_VARS)} required env vars set" if passed else f"Missing: {missing}",
             {"found": found, "missing": missing, "masked_values": masked}
         )
-        return passed
-    
-    def verify_optional_env_vars(self) -> bool:
-        """Check optional environment variables (ServiceNow)."""
-        found = []
-        missing = []
         
-        for var in self.OPTIONAL_ENV_VARS:
-            if os.environ.get(var):
-                found.append(var)
-            else:
-                missing.append(var)
+        optional_found = [var for var in self.OPTIONAL_ENV_VARS if env[var]]
+        optional_missing = [var for var in self.OPTIONAL_ENV_VARS if not env[var]]
         
         # Optional - just report status
-        passed = True
-        message = f"{len(found)}/{len(self.OPTIONAL_ENV_VARS)} ServiceNow env vars set"
-        if len(found) == 0:
+        message = f"{len(optional_found)}/{len(self.OPTIONAL_ENV_VARS)} ServiceNow env vars set"
+        if len(optional_found) == 0:
             message += " (ServiceNow tests will be skipped)"
         
         self._add_result(
             "ServiceNow Config",
-            passed,
+            True,
             message,
-            {"found": found, "missing": missing}
+            {"found": optional_found, "missing": optional_missing}
         )
         return passed
     
@@ -225,12 +316,12 @@ class EnvVerifier:
             return False
     
     def verify_openai_connection(self) -> bool:
-        """Check OpenAI API connection."""
+        """Check OpenAI API connection.
+
+        Sends a single short-timeout GET of /models?limit=1 through httpx (which
+        the OpenAI SDK depends on) and reports its latency.
+        """
         try:
-            from openai import OpenAI
-            from dotenv import load_dotenv
-            load_dotenv()
-            
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 self._add_result(
@@ -241,18 +332,16 @@ class EnvVerifier:
                 )
                 return False
             
-            client = OpenAI(api_key=api_key)
-            # Quick test - list models
-            models = client.models.list()
-            model_count = len(list(models)[:5])
-            
+            base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+            probe = _probe(f"{base_url}/models?limit=1", {"Authorization": f"Bearer {api_key}"})
+            passed = probe["status_code"] == 200
             self._add_result(
                 "OpenAI Connection",
-                True,
-                f"Connected to OpenAI API ({model_count}+ models available)",
-                {"model_count": model_count}
+                passed,
+                f"Connected to OpenAI API ({probe['elapsed_ms']} ms)" if passed else f"OpenAI API returned HTTP {probe['status_code']}",
+                probe
             )
-            return True
+            return passed
         except Exception as e:
             self._add_result(
                 "OpenAI Connection",
@@ -264,6 +353,25 @@ class EnvVerifier:
     
     def verify_playwright(self) -> bool:
         """Check Playwright is installed and has browsers."""
+        # In-process first: dist-info version plus the bundled driver, no child process
+        try:
+            version = metadata.version("playwright")
+            from playwright._impl._driver import compute_driver_executable
+            driver = compute_driver_executable()
+        except (metadata.PackageNotFoundError, ImportError):
+            pass  # fall back to the CLI below
+        else:
+            # Newer releases return (node, cli.js); older ones a single executable path
+            driver_paths = driver if isinstance(driver, tuple) else (driver,)
+            passed = all(os.path.exists(path) for path in driver_paths)
+            self._add_result(
+                "Playwright",
+                passed,
+                f"Playwright installed: {version}" if passed else f"Playwright {version} installed but its driver is missing",
+                {"version": version}
+            )
+            return passed
+        
         try:
             import subprocess
             result = subprocess.run(
@@ -309,9 +417,15 @@ class EnvVerifier:
     def verify_disk_space(self) -> bool:
         """Check available disk space."""
         try:
-            import shutil
-            total, used, free = shutil.disk_usage("/")
-            free_gb = free // (1024**3)
+            if hasattr(os, "statvfs"):
+                # statvfs directly: only the free/total block counts are needed
+                st = os.statvfs("/")
+                free_gb = (st.f_bavail * st.f_frsize) >> 30
+                total_gb = (st.f_blocks * st.f_frsize) >> 30
+            else:  # Windows has no statvfs
+                import shutil
+                total, _, free = shutil.disk_usage("/")
+                free_gb, total_gb = free >> 30, total >> 30
             
             passed = free_gb >= 1  # At least 1GB free
             
@@ -319,7 +433,7 @@ class EnvVerifier:
                 "Disk Space",
                 passed,
                 f"{free_gb}GB free disk space" if passed else f"Low disk space: {free_gb}GB",
-                {"free_gb": free_gb, "total_gb": total // (1024**3)}
+                {"free_gb": free_gb, "total_gb": total_gb}
             )
             return passed
         except Exception as e:
@@ -331,26 +445,30 @@ class EnvVerifier:
             )
             return True
     
+    def _run_check(self, check_name: str) -> List[EnvVerificationResult]:
+        """Run one check against a private result list so checks can run concurrently."""
+        worker = type(self)()
+        getattr(worker, check_name)()
+        return worker.results
+    
     def run_verification(self, quick: bool = False) -> EnvVerificationReport:
-        """Run all verification checks."""
+        """Run all verification checks.
+
+        The checks are independent and mostly I/O- or import-bound (API round
+        trip, subprocess, package imports), so they run on a thread pool; wall
+        time is roughly that of the slowest check. Results keep check order.
+        """
         print(f"\n{'='*60}")
         print("🔧 ENVIRONMENT VERIFICATION")
         print(f"{'='*60}")
         
-        self.verify_python_version()
-        self.verify_required_packages()
-        self.verify_optional_packages()
-        self.verify_env_vars()
-        self.verify_optional_env_vars()
-        self.verify_browsergym_import()
-        
-        if not quick:
-            self.verify_openai_connection()
-            self.verify_playwright()
-            self.verify_disk_space()
+        checks = self.QUICK_CHECKS if quick else self.QUICK_CHECKS + self.SLOW_CHECKS
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            for results in pool.map(self._run_check, checks):
+                self.results.extend(results)
         
         passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        failed = len(self.results) - passed
         
         return EnvVerificationReport(
             timestamp=datetime.now().isoformat(),
@@ -367,54 +485,126 @@ class EnvVerifier:
 
 def print_report(report: EnvVerificationReport):
     """Print verification report."""
-    print(f"\n{'─'*60}")
-    print("📋 ENVIRONMENT VERIFICATION RESULTS")
-    print(f"{'─'*60}")
+    lines = [
+        f"\n{_RULE}",
+        "📋 ENVIRONMENT VERIFICATION RESULTS",
+        _RULE,
+    ]
     
     for result in report.results:
         status = "✅" if result.passed else "❌"
-        print(f"  {status} {result.name}: {result.message}")
+        lines.append(f"  {status} {result.name}: {result.message}")
     
-    print(f"\n{'─'*60}")
-    print(f"📊 SUMMARY")
-    print(f"{'─'*60}")
-    print(f"  Total Checks: {report.total_checks}")
-    print(f"  Passed: {report.passed_checks}")
-    print(f"  Failed: {report.failed_checks}")
-    print(f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%")
-    print(f"  Environment Ready: {'✅ YES' if report.summary['env_ready'] else '❌ NO'}")
-    print(f"{'='*60}\n")
-
-
-def verify_environment(quick: bool = False, save_report: bool = True) -> EnvVerificationReport:
-    """Main function to verify environment."""
-    verifier = EnvVerifier()
-    report = verifier.run_verification(quick=quick)
+    lines += [
+        f"\n{_RULE}",
+        "📊 SUMMARY",
+        _RULE,
+        f"  Total Checks: {report.total_checks}",
+        f"  Passed: {report.passed_checks}",
+        f"  Failed: {report.failed_checks}",
+        f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%",
+        f"  Environment Ready: {'✅ YES' if report.summary['env_ready'] else '❌ NO'}",
+        f"{_BANNER}\n",
+    ]
+    # One write instead of a print (and possible flush) per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _report_to_dict(report: EnvVerificationReport) -> Dict[str, Any]:
+    """Convert a report into its JSON form (summary before the per-check results)."""
+    return {
+        "timestamp": report.timestamp,
+        "total_checks": report.total_checks,
+        "passed_checks": report.passed_checks,
+        "failed_checks": report.failed_checks,
+        "summary": report.summary,
+        "results": [asdict(r) for r in report.results],
+    }
+
+
+def _report_from_dict(data: Dict[str, Any]) -> EnvVerificationReport:
+    """Rebuild a report from its JSON form."""
+    return EnvVerificationReport(
+        timestamp=data["timestamp"],
+        total_checks=data["total_checks"],
+        passed_checks=data["passed_checks"],
+        failed_checks=data["failed_checks"],
+        results=[EnvVerificationResult(**r) for r in data["results"]],
+        summary=data["summary"],
+    )
+
+
+def _env_fingerprint(quick: bool) -> str:
+    """Hash what the checks depend on: interpreter, installed packages and env vars.
+
+    Installed packages are summarised by the name and mtime of every entry in
+    site-packages, which changes on any install/upgrade/uninstall. Env var
+    values are hashed, never stored.
+    """
+    _load_env_once()  # the checks see .env values too
+    purelib = Path(sysconfig.get_paths()["purelib"])
+    try:
+        packages = sorted((p.name, p.stat().st_mtime_ns) for p in purelib.iterdir())
+    except OSError:
+        packages = []
+    env_vars = [(var, os.environ.get(var)) for var in EnvVerifier.REQUIRED_ENV_VARS + EnvVerifier.OPTIONAL_ENV_VARS]
+    key = repr((sys.version, sys.prefix, quick, packages, env_vars)).encode()
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def _load_cached_report(cache_path: Path) -> EnvVerificationReport:
+    """Return the cached report at cache_path if it is fresh, else None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > CACHE_TTL_S:
+            return None
+        return _report_from_dict(json.loads(cache_path.read_bytes()))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def verify_environment(quick: bool = False, save_report: bool = True, use_cache: bool = False) -> EnvVerificationReport:
+    """Main function to verify environment.
+
+    With save_report, the report is written to env_verification_report.json
+    and appended as one line to env_verification_history.jsonl; a report
+    reused from the cache is saved with `"cached": true`.
+
+    With use_cache (off by default), a passing report is stored under
+    CACHE_DIR keyed by an environment fingerprint and reused for CACHE_TTL_S
+    seconds; failing reports are never cached, so fixes are picked up
+    immediately. The fingerprint only covers local state, so a cached report
+    does not notice a revoked API key or an OpenAI outage.
+    """
+    cache_path = CACHE_DIR / f"{_env_fingerprint(quick)}.json" if use_cache else None
+    report = _load_cached_report(cache_path) if cache_path else None
+    cached = report is not None
+    if cached:
+        print(f"♻️  Using cached environment report from {report.timestamp}")
+    else:
+        verifier = EnvVerifier()
+        report = verifier.run_verification(quick=quick)
+        if cache_path and report.summary["env_ready"]:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(_dumps(_report_to_dict(report)))
+            except OSError:
+                pass  # caching is best-effort
     
     print_report(report)
     
     if save_report:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         report_path = os.path.join(script_dir, "env_verification_report.json")
-        report_dict = {
-            "timestamp": report.timestamp,
-            "total_checks": report.total_checks,
-            "passed_checks": report.passed_checks,
-            "failed_checks": report.failed_checks,
-            "summary": report.summary,
-            "results": [
-                {
-                    "name": r.name,
-                    "passed": r.passed,
-                    "message": r.message,
-                    "details": r.details
-                }
-                for r in report.results
-            ]
-        }
-        with open(report_path, 'w') as f:
-            json.dump(report_dict, f, indent=2)
-        print(f"💾 Report saved to: {report_path}")
+        report_dict = _report_to_dict(report)
+        if cached:
+            report_dict["cached"] = True
+        with open(report_path, 'wb') as f:
+            f.write(_dumps(report_dict))
+        # One line per run, never rewritten; `tail -n 1` gives the latest run
+        history_path = os.path.join(script_dir, "env_verification_history.jsonl")
+        with open(history_path, 'ab') as f:
+            f.write(_dumps_line(report_dict))
+        print(f"💾 Report saved to: {report_path} (history: {history_path})")
     
     return report
 
@@ -425,8 +615,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Verify BrowserGym environment setup")
     parser.add_argument("--quick", action="store_true", help="Skip slow checks (API, Playwright)")
     parser.add_argument("--no-save", action="store_true", help="Don't save verification report")
+    parser.add_argument("--cache", action="store_true", help=f"Reuse a passing report for up to {CACHE_TTL_S}s while the local environment is unchanged")
     
     args = parser.parse_args()
     
-    verify_environment(quick=args.quick, save_report=not args.no_save)
+    verify_environment(quick=args.quick, save_report=not args.no_save, use_cache=args.cache)
 
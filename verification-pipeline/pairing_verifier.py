@@ -9,16 +9,96 @@ Checks:
 - Data completeness
 """
 
+import functools
 import json
 import os
-import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 import sys
+from collections import Counter
+from operator import methodcaller
+from types import MappingProxyType
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency; fall back to pure Python
+    np = None
+
+# Required keys per step / action / observation; frozenset.difference(dict) does the lookups in C.
+REQUIRED_STEP_FIELDS = frozenset(("step", "action", "observation"))
+REQUIRED_ACTION_FIELDS = frozenset(("action", "data_bid"))
+REQUIRED_OBS_FIELDS = frozenset(("timestamp", "url"))
+# Reporting order for missing fields, so reports don't depend on set iteration order
+_FIELD_ORDER = {name: rank for rank, name in enumerate(("step", "action", "observation", "data_bid", "timestamp", "url"))}
+
+
+# Shared read-only stand-in for a missing action/observation, so absent fields allocate nothing
+_NO_FIELDS = MappingProxyType({})
+
+_RULE = "─" * 60
+_BANNER = "=" * 60
+
+# Below this many steps the pure-Python comparison beats numpy's setup cost
+NUMPY_MIN_STEPS = 10_000
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Action type counts can be keyed by None (an explicit null type); stdlib json writes "null"
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _ordered(missing: frozenset) -> List[str]:
+    """List missing field names in their documented order."""
+    return sorted(missing, key=_FIELD_ORDER.__getitem__)
+
+
+def _has_required_fields(step: Dict, action: Dict, obs: Dict) -> bool:
+    """Are all REQUIRED_STEP/ACTION/OBS_FIELDS present?
+
+    Three C-level subset tests answer the common case (nothing missing)
+    without building the difference sets, which only run for steps that
+    fail it, to report exactly which fields are missing.
+    """
+    return (
+        REQUIRED_STEP_FIELDS.issubset(step)
+        and REQUIRED_ACTION_FIELDS.issubset(action)
+        and REQUIRED_OBS_FIELDS.issubset(obs)
+    )
+
+
+def _misaligned_indices(obs_ts: List[Any], event_ts: List[Any]) -> List[int]:
+    """Indices where the observation is newer than a recorded (> 0) event timestamp."""
+    if np is not None and len(obs_ts) >= NUMPY_MIN_STEPS:
+        types = set(map(type, obs_ts)) | set(map(type, event_ts))
+        if types <= {int, float}:
+            dtype = np.int64 if types == {int} else np.float64
+            try:
+                obs = np.fromiter(obs_ts, dtype=dtype, count=len(obs_ts))
+                ev = np.fromiter(event_ts, dtype=dtype, count=len(event_ts))
+            except OverflowError:
+                obs = None
+            if obs is not None:
+                return np.flatnonzero((obs > ev) & (ev > 0)).tolist()
+    return [i for i, (o, e) in enumerate(zip(obs_ts, event_ts)) if o > e and e > 0]
+
 
 @dataclass
 class PairingVerificationResult:
@@ -41,17 +121,73 @@ class PairingVerificationReport:
     summary: Dict[str, Any] = field(default_factory=dict)
 
 
+def _requires_trajectory(name: str):
+    """Decorate a per-step check to record a trivial pass when there are no steps.
+
+    An empty trajectory is already reported by verify_trajectory_present, so the
+    per-step checks skip their scan and don't add failures of their own.
+    """
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self) -> bool:
+            if not self.trajectory:
+                self._add_result(name, True, "No trajectory", {})
+                return True
+            return check(self)
+        return wrapper
+    return decorator
+
+
+@dataclass
+class _TrajectoryScan:
+    """Per-check accumulators gathered in one pass over the trajectory.
+
+    The invalid_* and misaligned sample lists keep at most
+    PairingVerifier.MAX_SAMPLES entries; the matching *_count fields hold the
+    exact totals.
+    """
+    invalid_steps: List[Dict[str, Any]] = field(default_factory=list)
+    invalid_step_count: int = 0
+    invalid_actions: List[Dict[str, Any]] = field(default_factory=list)
+    invalid_action_count: int = 0
+    action_types: Dict[str, int] = field(default_factory=dict)
+    invalid_observations: List[Dict[str, Any]] = field(default_factory=list)
+    invalid_observation_count: int = 0
+    bid_found_count: int = 0
+    bid_missing_count: int = 0
+    not_tracked_count: int = 0
+    misaligned_count: int = 0
+    misaligned_samples: List[Dict[str, Any]] = field(default_factory=list)
+    with_role: int = 0
+    with_name: int = 0
+    with_tag: int = 0
+
+
 class PairingVerifier:
     """Verifies observation-action pairing quality."""
     
+    # Offending steps shown per check; the counts in the messages stay exact
+    MAX_SAMPLES = 5
+    
     def __init__(self, trajectory_data: Dict):
         self.trajectory_data = trajectory_data
         self.trajectory = trajectory_data.get("trajectory", [])
         self.stats = trajectory_data.get("stats", {})
         self.results: List[PairingVerificationResult] = []
+        self._passed_count = self._failed_count = 0
+        self._scan_cache: _TrajectoryScan = None
+        # Per-field columns read once here, so the checks index lists instead of
+        # re-reading the same keys from every step dict
+        self._step_nums: List[Any] = [s.get("step", idx) for idx, s in enumerate(self.trajectory)]
+        self._actions: List[Dict] = [s.get("action") or _NO_FIELDS for s in self.trajectory]
+        self._observations: List[Dict] = [s.get("observation") or _NO_FIELDS for s in self.trajectory]
     
     def _add_result(self, name: str, passed: bool, message: str, details: Dict = None):
         """Add a verification result."""
+        if passed:
+            self._passed_count += 1
+        else:
+            self._failed_count += 1
         self.results.append(PairingVerificationResult(
             name=name,
             passed=passed,
@@ -59,6 +195,93 @@ class PairingVerifier:
             details=details or {}
         ))
     
+    def _scan_trajectory(self) -> _TrajectoryScan:
+        """Walk the trajectory once, collecting what every per-step check needs.
+
+        Computed on first use and cached, so running all checks costs a single
+        pass over the trajectory instead of one pass per check.
+        """
+        if self._scan_cache is not None:
+            return self._scan_cache
+        scan = _TrajectoryScan()
+        # Action type histogram in one C-level count (first-seen order, like the dict it replaces)
+        scan.action_types = dict(Counter(map(methodcaller("get", "action", "unknown"), self._actions)))
+        cap = self.MAX_SAMPLES
+        invalid_steps = invalid_actions = invalid_observations = 0
+        bid_found_count = bid_missing_count = not_tracked_count = 0
+        with_role = with_name = with_tag = 0
+        obs_timestamps, event_timestamps = [], []
+        
+        has_required_fields = _has_required_fields
+        columns = zip(self.trajectory, self._step_nums, self._actions, self._observations)
+        for idx, (step, step_num, action, obs) in enumerate(columns):
+            if not has_required_fields(step, action, obs):
+                # Step structure
+                missing = REQUIRED_STEP_FIELDS.difference(step)
+                if missing:
+                    invalid_steps += 1
+                    if invalid_steps <= cap:
+                        scan.invalid_steps.append({
+                            "step_index": idx,
+                            "step_number": step_num,
+                            "missing_fields": _ordered(missing)
+                        })
+                
+                # Action format
+                missing = REQUIRED_ACTION_FIELDS.difference(action)
+                if missing:
+                    invalid_actions += 1
+                    if invalid_actions <= cap:
+                        scan.invalid_actions.append({"step": step_num, "missing": _ordered(missing)})
+                
+                # Observation format
+                missing = REQUIRED_OBS_FIELDS.difference(obs)
+                if missing:
+                    invalid_observations += 1
+                    if invalid_observations <= cap:
+                        scan.invalid_observations.append({"step": step_num, "missing": _ordered(missing)})
+            
+            # BID presence
+            bid_found = step.get("bid_found_in_html")
+            if bid_found is True:
+                bid_found_count += 1
+            elif bid_found is False:
+                bid_missing_count += 1
+            else:
+                not_tracked_count += 1
+            
+            # Temporal alignment (compared after the loop)
+            obs_timestamps.append(obs.get("timestamp", 0))
+            event_timestamps.append(step.get("event_timestamp", 0))
+            
+            # Element info
+            elem_info = step.get("element_info", {})
+            if elem_info.get("role"):
+                with_role += 1
+            if elem_info.get("name"):
+                with_name += 1
+            if elem_info.get("tagName"):
+                with_tag += 1
+        
+        scan.invalid_step_count, scan.invalid_action_count = invalid_steps, invalid_actions
+        scan.invalid_observation_count = invalid_observations
+        scan.bid_found_count, scan.bid_missing_count, scan.not_tracked_count = bid_found_count, bid_missing_count, not_tracked_count
+        scan.with_role, scan.with_name, scan.with_tag = with_role, with_name, with_tag
+        
+        # Only the reported samples are turned into dicts
+        misaligned = _misaligned_indices(obs_timestamps, event_timestamps)
+        scan.misaligned_count = len(misaligned)
+        for i in misaligned[:cap]:
+            obs_ts, event_ts = obs_timestamps[i], event_timestamps[i]
+            scan.misaligned_samples.append({
+                "step": self.trajectory[i].get("step", 0),
+                "obs_ts": obs_ts,
+                "event_ts": event_ts,
+                "diff_ms": obs_ts - event_ts
+            })
+        self._scan_cache = scan
+        return scan
+    
     def verify_trajectory_present(self) -> bool:
         """Check if trajectory array exists and is non-empty."""
         has_trajectory = len(self.trajectory) > 0
@@ -99,126 +322,72 @@ class PairingVerifier:
         )
         return passed
     
+    @_requires_trajectory("Step Structure")
     def verify_step_structure(self) -> bool:
         """Verify each step has required fields."""
-        required_fields = ["step", "action", "observation"]
-        optional_fields = ["bid_found_in_html", "element_info", "event_type"]
+        scan = self._scan_trajectory()
+        invalid_count = scan.invalid_step_count
         
-        invalid_steps = []
-        
-        for idx, step in enumerate(self.trajectory):
-            missing = []
-            for field in required_fields:
-                if field not in step:
-                    missing.append(field)
-            
-            if missing:
-                invalid_steps.append({
-                    "step_index": idx,
-                    "step_number": step.get("step", idx),
-                    "missing_fields": missing
-                })
-        
-        passed = len(invalid_steps) == 0
+        passed = invalid_count == 0
         
         self._add_result(
             "Step Structure",
             passed,
-            f"All {len(self.trajectory)} steps have required fields" if passed else f"{len(invalid_steps)} steps missing fields",
+            f"All {len(self.trajectory)} steps have required fields" if passed else f"{invalid_count} steps missing fields",
             {
                 "total_steps": len(self.trajectory),
-                "valid_steps": len(self.trajectory) - len(invalid_steps),
-                "invalid_steps": invalid_steps[:5]
+                "valid_steps": len(self.trajectory) - invalid_count,
+                "invalid_steps": scan.invalid_steps
             }
         )
         return passed
     
+    @_requires_trajectory("Action Format")
     def verify_action_format(self) -> bool:
         """Verify action format in each step."""
-        action_fields = ["action", "data_bid"]
-        invalid_actions = []
-        action_types = {}
-        
-        for idx, step in enumerate(self.trajectory):
-            action = step.get("action", {})
-            step_num = step.get("step", idx)
-            
-            # Check action type
-            action_type = action.get("action", "unknown")
-            action_types[action_type] = action_types.get(action_type, 0) + 1
-            
-            # Check for required action fields
-            missing = []
-            for field in action_fields:
-                if field not in action:
-                    missing.append(field)
-            
-            if missing:
-                invalid_actions.append({
-                    "step": step_num,
-                    "missing": missing
-                })
+        scan = self._scan_trajectory()
+        invalid_count = scan.invalid_action_count
+        action_types = scan.action_types
         
-        passed = len(invalid_actions) == 0
+        passed = invalid_count == 0
         
         self._add_result(
             "Action Format",
             passed,
-            f"All actions have valid format" if passed else f"{len(invalid_actions)} actions have invalid format",
+            f"All actions have valid format" if passed else f"{invalid_count} actions have invalid format",
             {
                 "action_types": action_types,
-                "invalid_actions": invalid_actions[:5]
+                "invalid_actions": scan.invalid_actions
             }
         )
         return passed
     
+    @_requires_trajectory("Observation Format")
     def verify_observation_format(self) -> bool:
         """Verify observation format in each step."""
-        observation_fields = ["timestamp", "url"]
-        invalid_observations = []
+        scan = self._scan_trajectory()
+        invalid_count = scan.invalid_observation_count
         
-        for idx, step in enumerate(self.trajectory):
-            obs = step.get("observation", {})
-            step_num = step.get("step", idx)
-            
-            missing = []
-            for field in observation_fields:
-                if field not in obs:
-                    missing.append(field)
-            
-            if missing:
-                invalid_observations.append({
-                    "step": step_num,
-                    "missing": missing
-                })
-        
-        passed = len(invalid_observations) == 0
+        passed = invalid_count == 0
         
         self._add_result(
             "Observation Format",
             passed,
-            f"All observations have valid format" if passed else f"{len(invalid_observations)} observations have invalid format",
+            f"All observations have valid format" if passed else f"{invalid_count} observations have invalid format",
             {
                 "total_observations": len(self.trajectory),
-                "invalid_observations": invalid_observations[:5]
+                "invalid_observations": scan.invalid_observations
             }
         )
         return passed
     
+    @_requires_trajectory("BID-HTML Presence")
     def verify_bid_html_presence(self) -> bool:
         """Verify BID presence in HTML (if tracked)."""
-        bid_found_count = 0
-        bid_missing_count = 0
-        not_tracked_count = 0
-        
-        for step in self.trajectory:
-            bid_found = step.get("bid_found_in_html")
-            if bid_found is True:
-                bid_found_count += 1
-            elif bid_found is False:
-                bid_missing_count += 1
-            else:
-                not_tracked_count += 1
+        scan = self._scan_trajectory()
+        bid_found_count = scan.bid_found_count
+        bid_missing_count = scan.bid_missing_count
+        not_tracked_count = scan.not_tracked_count
         
         total_tracked = bid_found_count + bid_missing_count
         
@@ -252,21 +421,17 @@ class PairingVerifier:
         if not self.trajectory:
             return True
         
-        steps = [s.get("step", idx) for idx, s in enumerate(self.trajectory)]
-        expected_steps = list(range(1, len(self.trajectory) + 1))
-        
-        gaps = []
-        duplicates = []
-        seen = set()
+        steps = self._step_nums
+        expected_steps = range(1, len(self.trajectory) + 1)
         
-        for step in steps:
-            if step in seen:
-                duplicates.append(step)
-            seen.add(step)
-        
-        for expected in expected_steps:
-            if expected not in seen:
-                gaps.append(expected)
+        if steps == list(expected_steps):
+            # Common case: exactly 1..N in order, nothing to count
+            gaps = []
+            duplicates = []
+        else:
+            step_counts = Counter(steps)
+            duplicates = [step for step, count in step_counts.items() if count > 1]
+            gaps = sorted(set(expected_steps).difference(step_counts))
         
         passed = len(gaps) == 0 and len(duplicates) == 0
         
@@ -282,54 +447,33 @@ class PairingVerifier:
         )
         return passed
     
+    @_requires_trajectory("Temporal Alignment")
     def verify_temporal_alignment(self) -> bool:
         """Verify observation timestamps precede action timestamps."""
-        misaligned = []
+        scan = self._scan_trajectory()
+        misaligned_count = scan.misaligned_count
         
-        for step in self.trajectory:
-            obs = step.get("observation", {})
-            obs_ts = obs.get("timestamp", 0)
-            event_ts = step.get("event_timestamp", 0)
-            step_num = step.get("step", 0)
-            
-            if obs_ts > event_ts and event_ts > 0:
-                misaligned.append({
-                    "step": step_num,
-                    "obs_ts": obs_ts,
-                    "event_ts": event_ts,
-                    "diff_ms": obs_ts - event_ts
-                })
-        
-        passed = len(misaligned) < len(self.trajectory) * 0.1  # Allow 10% misalignment
+        passed = misaligned_count < len(self.trajectory) * 0.1  # Allow 10% misalignment
         
         self._add_result(
             "Temporal Alignment",
             passed,
-            f"Observation-action temporal alignment OK" if passed else f"{len(misaligned)} misaligned pairs",
+            f"Observation-action temporal alignment OK" if passed else f"{misaligned_count} misaligned pairs",
             {
                 "total_pairs": len(self.trajectory),
-                "misaligned": len(misaligned),
-                "misaligned_samples": misaligned[:5]
+                "misaligned": misaligned_count,
+                "misaligned_samples": scan.misaligned_samples
             }
         )
         return passed
     
+    @_requires_trajectory("Element Info Quality")
     def verify_element_info_quality(self) -> bool:
         """Verify element info quality."""
-        with_role = 0
-        with_name = 0
-        with_tag = 0
+        scan = self._scan_trajectory()
+        with_role, with_name, with_tag = scan.with_role, scan.with_name, scan.with_tag
         total = len(self.trajectory)
         
-        for step in self.trajectory:
-            elem_info = step.get("element_info", {})
-            if elem_info.get("role"):
-                with_role += 1
-            if elem_info.get("name"):
-                with_name += 1
-            if elem_info.get("tagName"):
-                with_tag += 1
-        
         # At least 50% should have some element info
         quality_score = (with_role + with_name + with_tag) / (total * 3) if total > 0 else 0
         passed = quality_score >= 0.3
@@ -388,9 +532,7 @@ class PairingVerifier:
     
     def run_verification(self) -> PairingVerificationReport:
         """Run all verification checks."""
-        print(f"\n{'='*60}")
-        print("🔗 PAIRING VERIFICATION")
-        print(f"{'='*60}")
+        sys.stdout.write(f"\n{_BANNER}\n🔗 PAIRING VERIFICATION\n{_BANNER}\n")
         
         self.verify_trajectory_present()
         self.verify_stats_present()
@@ -403,8 +545,8 @@ class PairingVerifier:
         self.verify_element_info_quality()
         self.verify_stats_consistency()
         
-        passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        passed = self._passed_count
+        failed = self._failed_count
         
         return PairingVerificationReport(
             trajectory_path="",
@@ -423,23 +565,29 @@ class PairingVerifier:
 
 def print_report(report: PairingVerificationReport):
     """Print verification report."""
-    print(f"\n{'─'*60}")
-    print("📋 PAIRING VERIFICATION RESULTS")
-    print(f"{'─'*60}")
+    lines = [
+        f"\n{_RULE}",
+        "📋 PAIRING VERIFICATION RESULTS",
+        _RULE,
+    ]
     
     for result in report.results:
         status = "✅" if result.passed else "❌"
-        print(f"  {status} {result.name}: {result.message}")
+        lines.append(f"  {status} {result.name}: {result.message}")
     
-    print(f"\n{'─'*60}")
-    print(f"📊 SUMMARY")
-    print(f"{'─'*60}")
-    print(f"  Total Checks: {report.total_checks}")
-    print(f"  Passed: {report.passed_checks}")
-    print(f"  Failed: {report.failed_checks}")
-    print(f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%")
-    print(f"  Pairing Valid: {'✅ YES' if report.summary['pairing_valid'] else '❌ NO'}")
-    print(f"{'='*60}\n")
+    lines += [
+        f"\n{_RULE}",
+        "📊 SUMMARY",
+        _RULE,
+        f"  Total Checks: {report.total_checks}",
+        f"  Passed: {report.passed_checks}",
+        f"  Failed: {report.failed_checks}",
+        f"  Success Rate: {report.summary.get('success_rate', 0):.1f}%",
+        f"  Pairing Valid: {'✅ YES' if report.summary['pairing_valid'] else '❌ NO'}",
+        f"{_BANNER}\n",
+    ]
+    # One write instead of a print (and possible flush) per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def verify_pairing(trajectory_path: str = None, trajectory_data: Dict = None, save_report: bool = True) -> PairingVerificationReport:
@@ -447,8 +595,8 @@ def verify_pairing(trajectory_path: str = None, trajectory_data: Dict = None, sa
     if trajectory_data is None:
         if trajectory_path is None:
             raise ValueError("Must provide either trajectory_path or trajectory_data")
-        with open(trajectory_path, 'r', encoding='utf-8') as f:
-            trajectory_data = json.load(f)
+        with open(trajectory_path, 'rb') as f:
+            trajectory_data = _loads(f.read())
     
     verifier = PairingVerifier(trajectory_data)
     report = verifier.run_verification()
@@ -475,8 +623,8 @@ def verify_pairing(trajectory_path: str = None, trajectory_data: Dict = None, sa
                 for r in report.results
             ]
         }
-        with open(report_path, 'w') as f:
-            json.dump(report_dict, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(_dumps(report_dict))
         print(f"💾 Report saved to: {report_path}")
     
     return report
@@ -12,7 +12,7 @@ Checks:
 import json
 import os
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 import sys
@@ -57,6 +57,45 @@ class PromptVerifier:
         r'select_option\(["\'][^"\']+["\'],\s*["\'][^"\']*["\']\)',
     ]
     
+    GOAL_KEYWORDS = ("goal", "task", "objective", "create", "fill", "submit")
+    PATTERN_KEYWORDS = ("pattern", "workflow", "how to", "tip", "important", "critical")
+    DOMAIN_KEYWORDS = ("servicenow", "hardware asset", "form", "lookup", "textbox", "dropdown")
+    
+    # Every regex the checks use, compiled once with the class instead of
+    # going through re's pattern cache on each call
+    _STEP_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'step\s+\d+',
+        r'##+\s*step\s+\d+',
+        r'\*\*step\s+\d+\*\*',
+    ))
+    _DIGITS_RE = re.compile(r'\d+')
+    _ACTION_RES = dict(zip(("click", "fill", "select_option"), map(re.compile, ACTION_PATTERNS)))
+    _ELEMENT_RES = {
+        "role": re.compile(r'role[=:]["\']\w+', re.IGNORECASE),
+        "name": re.compile(r'name[=:]["\'][^"\']+["\']', re.IGNORECASE),
+        "bid": re.compile(r'bid[=:]?["\']?\w+', re.IGNORECASE),
+        "element": re.compile(r'\belement\b', re.IGNORECASE),
+    }
+    _GOAL_RES = {kw: re.compile(rf'\b{kw}\b', re.IGNORECASE) for kw in GOAL_KEYWORDS}
+    _PATTERN_KEYWORD_RES = {kw: re.compile(rf'\b{kw}s?\b', re.IGNORECASE) for kw in PATTERN_KEYWORDS}
+    _DOMAIN_RES = {kw: re.compile(rf'\b{kw}\b', re.IGNORECASE) for kw in DOMAIN_KEYWORDS}
+    _FORMATTING_RES = {
+        "headers": re.compile(r'^#+\s+', re.MULTILINE),
+        "bold": re.compile(r'\*\*[^*]+\*\*'),
+        "code_inline": re.compile(r'`[^`]+`'),
+        "code_blocks": re.compile(r'```[\s\S]*?```'),
+        "lists": re.compile(r'^[-*]\s+', re.MULTILINE),
+        "numbered_lists": re.compile(r'^\d+\.\s+', re.MULTILINE),
+    }
+    _PLACEHOLDER_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'\[TODO\]',
+        r'\[PLACEHOLDER\]',
+        r'<INSERT.*>',
+        r'\{.*\}',  # Curly brace placeholders
+        r'XXX',
+        r'FIXME',
+    ))
+    
     def __init__(self, prompt_content: str):
         self.prompt = prompt_content
         self.results: List[PromptVerificationResult] = []
@@ -122,21 +161,14 @@ class PromptVerifier:
     def verify_step_format(self) -> bool:
         """Verify step-by-step demonstration format."""
         # Look for step patterns like "Step 1", "### Step 1", etc.
-        step_patterns = [
-            r'step\s+\d+',
-            r'##+\s*step\s+\d+',
-            r'\*\*step\s+\d+\*\*',
-        ]
-        
         steps_found = []
-        for pattern in step_patterns:
-            matches = re.findall(pattern, self.prompt, re.IGNORECASE)
-            steps_found.extend(matches)
+        for pattern in self._STEP_RES:
+            steps_found.extend(pattern.findall(self.prompt))
         
         # Extract step numbers
         step_numbers = []
         for step in steps_found:
-            num_match = re.search(r'\d+', step)
+            num_match = self._DIGITS_RE.search(step)
             if num_match:
                 step_numbers.append(int(num_match.group()))
         
@@ -164,12 +196,8 @@ class PromptVerifier:
             "select_option": []
         }
         
-        for action_type, pattern in [
-            ("click", r'click\(["\'][^"\']+["\']\)'),
-            ("fill", r'fill\(["\'][^"\']+["\'],\s*["\'][^"\']*["\']\)'),
-            ("select_option", r'select_option\(["\'][^"\']+["\'],\s*["\'][^"\']*["\']\)')
-        ]:
-            matches = re.findall(pattern, self.prompt)
+        for action_type, pattern in self._ACTION_RES.items():
+            matches = pattern.findall(self.prompt)
             actions_found[action_type] = matches[:5]  # Keep first 5 examples
         
         total_actions = sum(len(v) for v in actions_found.values())
@@ -192,10 +220,8 @@ class PromptVerifier:
     def verify_element_references(self) -> bool:
         """Verify element references (role, name, bid) are present."""
         references = {
-            "role": len(re.findall(r'role[=:]["\']\w+', self.prompt, re.IGNORECASE)),
-            "name": len(re.findall(r'name[=:]["\'][^"\']+["\']', self.prompt, re.IGNORECASE)),
-            "bid": len(re.findall(r'bid[=:]?["\']?\w+', self.prompt, re.IGNORECASE)),
-            "element": len(re.findall(r'\belement\b', self.prompt, re.IGNORECASE))
+            ref: len(pattern.findall(self.prompt))
+            for ref, pattern in self._ELEMENT_RES.items()
         }
         
         total_refs = sum(references.values())
@@ -212,11 +238,10 @@ class PromptVerifier:
     
     def verify_goal_references(self) -> bool:
         """Verify goal/task references are present."""
-        goal_keywords = ["goal", "task", "objective", "create", "fill", "submit"]
         found_keywords = {}
         
-        for keyword in goal_keywords:
-            count = len(re.findall(rf'\b{keyword}\b', self.prompt, re.IGNORECASE))
+        for keyword, pattern in self._GOAL_RES.items():
+            count = len(pattern.findall(self.prompt))
             if count > 0:
                 found_keywords[keyword] = count
         
@@ -237,18 +262,9 @@ class PromptVerifier:
     
     def verify_patterns_section(self) -> bool:
         """Verify key patterns section exists."""
-        pattern_keywords = [
-            "pattern",
-            "workflow",
-            "how to",
-            "tip",
-            "important",
-            "critical"
-        ]
-        
         found = {}
-        for keyword in pattern_keywords:
-            count = len(re.findall(rf'\b{keyword}s?\b', self.prompt, re.IGNORECASE))
+        for keyword, pattern in self._PATTERN_KEYWORD_RES.items():
+            count = len(pattern.findall(self.prompt))
             if count > 0:
                 found[keyword] = count
         
@@ -269,18 +285,9 @@ class PromptVerifier:
     
     def verify_servicenow_context(self) -> bool:
         """Verify ServiceNow-specific context (if applicable)."""
-        sn_keywords = [
-            "servicenow",
-            "hardware asset",
-            "form",
-            "lookup",
-            "textbox",
-            "dropdown"
-        ]
-        
         found = {}
-        for keyword in sn_keywords:
-            count = len(re.findall(rf'\b{keyword}\b', self.prompt, re.IGNORECASE))
+        for keyword, pattern in self._DOMAIN_RES.items():
+            count = len(pattern.findall(self.prompt))
             if count > 0:
                 found[keyword] = count
         
@@ -303,12 +310,8 @@ class PromptVerifier:
     def verify_markdown_formatting(self) -> bool:
         """Verify markdown formatting is consistent."""
         formatting_elements = {
-            "headers": len(re.findall(r'^#+\s+', self.prompt, re.MULTILINE)),
-            "bold": len(re.findall(r'\*\*[^*]+\*\*', self.prompt)),
-            "code_inline": len(re.findall(r'`[^`]+`', self.prompt)),
-            "code_blocks": len(re.findall(r'```[\s\S]*?```', self.prompt)),
-            "lists": len(re.findall(r'^[-*]\s+', self.prompt, re.MULTILINE)),
-            "numbered_lists": len(re.findall(r'^\d+\.\s+', self.prompt, re.MULTILINE))
+            element: len(pattern.findall(self.prompt))
+            for element, pattern in self._FORMATTING_RES.items()
         }
         
         total_formatting = sum(formatting_elements.values())
@@ -326,18 +329,9 @@ class PromptVerifier:
     
     def verify_no_placeholders(self) -> bool:
         """Verify no incomplete placeholders remain."""
-        placeholder_patterns = [
-            r'\[TODO\]',
-            r'\[PLACEHOLDER\]',
-            r'<INSERT.*>',
-            r'\{.*\}',  # Curly brace placeholders
-            r'XXX',
-            r'FIXME'
-        ]
-        
         found_placeholders = []
-        for pattern in placeholder_patterns:
-            matches = re.findall(pattern, self.prompt, re.IGNORECASE)
+        for pattern in self._PLACEHOLDER_RES:
+            matches = pattern.findall(self.prompt)
             if matches:
                 found_placeholders.extend(matches[:3])
         
@@ -371,7 +365,7 @@ class PromptVerifier:
         self.verify_no_placeholders()
         
         passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        failed = len(self.results) - passed
         
         return PromptVerificationReport(
             prompt_path="",
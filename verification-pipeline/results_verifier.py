@@ -419,7 +419,7 @@ class ResultsVerifier:
         self.verify_timestamps()
         
         passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        failed = len(self.results) - passed
         
         return ResultsVerificationReport(
             results_path="",
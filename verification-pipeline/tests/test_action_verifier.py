@@ -0,0 +1,19 @@
+"""Tests for ActionVerifier.ACTION_PATTERN."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from action_verifier import ActionVerifier  # noqa: E402
+
+
+@pytest.mark.parametrize("code", ["click('a12')", 'fill("b3", "hello")', "scroll(0, 200)", "noop()"])
+def test_action_pattern_matches_calls(code):
+    assert ActionVerifier.ACTION_PATTERN.match(code)
+
+
+@pytest.mark.parametrize("code", ["click('a')trailing", "click('a')\n", "x = click('a')", "press('a')"])
+def test_action_pattern_match_is_anchored(code):
+    assert ActionVerifier.ACTION_PATTERN.match(code) is None
@@ -0,0 +1,113 @@
+"""Tests for env_verifier's report cache and saved history."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import env_verifier  # noqa: E402
+
+
+def _passing_report():
+    return env_verifier.EnvVerificationReport(
+        timestamp="2026-01-01T00:00:00",
+        total_checks=1,
+        passed_checks=1,
+        failed_checks=0,
+        results=[env_verifier.EnvVerificationResult("Python Version", True, "ok")],
+        summary={"env_ready": True, "success_rate": 100.0},
+    )
+
+
+@pytest.fixture
+def isolated(monkeypatch, tmp_path):
+    """Write reports and the cache under tmp_path and count real verification runs."""
+    runs = []
+
+    def fake_run(self, quick=False):
+        runs.append(quick)
+        return _passing_report()
+
+    monkeypatch.setattr(env_verifier, "__file__", str(tmp_path / "env_verifier.py"))
+    monkeypatch.setattr(env_verifier, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(env_verifier.EnvVerifier, "run_verification", fake_run)
+    return tmp_path, runs
+
+
+def test_cache_hit_is_marked_in_history(isolated):
+    tmp_path, runs = isolated
+
+    env_verifier.verify_environment(quick=True, use_cache=True)
+    env_verifier.verify_environment(quick=True, use_cache=True)
+
+    history = [json.loads(line) for line in (tmp_path / "env_verification_history.jsonl").read_text().splitlines()]
+    assert runs == [True]
+    assert [entry.get("cached", False) for entry in history] == [False, True]
+    assert json.loads((tmp_path / "env_verification_report.json").read_text())["cached"] is True
+
+
+def test_cache_is_opt_in(isolated):
+    tmp_path, runs = isolated
+
+    env_verifier.verify_environment(quick=True)
+    env_verifier.verify_environment(quick=True)
+
+    assert runs == [True, True]
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.fixture
+def openai_responses(monkeypatch):
+    """Answer the OpenAI probe from an in-memory httpx transport with the given status."""
+    httpx = pytest.importorskip("httpx")
+    requests = []
+
+    def install(status_code):
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(status_code, json={"data": []})
+
+        real_probe = env_verifier._probe
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+        monkeypatch.setattr(
+            env_verifier, "_probe",
+            lambda url, headers: real_probe(url, headers, transport=httpx.MockTransport(handler)),
+        )
+        return requests
+
+    return install
+
+
+def test_openai_connection_ok(openai_responses):
+    requests = openai_responses(200)
+    verifier = env_verifier.EnvVerifier()
+
+    assert verifier.verify_openai_connection() is True
+    [result] = verifier.results
+    assert result.details["status_code"] == 200
+    assert result.details["elapsed_ms"] >= 0
+    assert str(requests[0].url) == "https://api.openai.com/v1/models?limit=1"
+    assert requests[0].headers["Authorization"] == "Bearer sk-test"
+
+
+def test_openai_connection_rejected(openai_responses):
+    openai_responses(401)
+    verifier = env_verifier.EnvVerifier()
+
+    assert verifier.verify_openai_connection() is False
+    [result] = verifier.results
+    assert result.message == "OpenAI API returned HTTP 401"
+    assert result.details["status_code"] == 401
+
+
+def test_saved_report_keeps_field_order(isolated):
+    tmp_path, _ = isolated
+
+    env_verifier.verify_environment(quick=True)
+
+    report = json.loads((tmp_path / "env_verification_report.json").read_text())
+    assert list(report) == ["timestamp", "total_checks", "passed_checks", "failed_checks", "summary", "results"]
+    assert list(report["results"][0]) == ["name", "passed", "message", "details"]
@@ -0,0 +1,31 @@
+"""Tests for pairing_verifier's required-field check."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pairing_verifier  # noqa: E402
+
+FIELD_SETS = {
+    "step": pairing_verifier.REQUIRED_STEP_FIELDS,
+    "action": pairing_verifier.REQUIRED_ACTION_FIELDS,
+    "obs": pairing_verifier.REQUIRED_OBS_FIELDS,
+}
+
+
+def _complete():
+    return {part: dict.fromkeys(fields, "x") for part, fields in FIELD_SETS.items()}
+
+
+def test_complete_step_has_required_fields():
+    assert pairing_verifier._has_required_fields(**_complete())
+
+
+@pytest.mark.parametrize("part, field", [(part, field) for part, fields in FIELD_SETS.items() for field in fields])
+def test_each_missing_field_is_detected(part, field):
+    parts = _complete()
+    del parts[part][field]
+
+    assert not pairing_verifier._has_required_fields(**parts)
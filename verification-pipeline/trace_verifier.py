@@ -426,7 +426,7 @@ class TraceVerifier:
     def _build_report(self) -> TraceVerificationReport:
         """Build final verification report."""
         passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        failed = len(self.results) - passed
         
         report = TraceVerificationReport(
             trace_path=self.trace_path,